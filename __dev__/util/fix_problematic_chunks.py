@@ -7,6 +7,7 @@ import json
 import sys
 import random
 import re
+import types
 from pathlib import Path
 from typing import List, Dict, Tuple
 from datetime import datetime
@@ -87,6 +88,13 @@ DOCUMENT_TEMPLATES = {
     }
 }
 
+# Freeze the templates: section lists become tuples and every mapping becomes
+# read-only, so lookups hit immutable structures and nothing can mutate them
+for _doc_type, _template in DOCUMENT_TEMPLATES.items():
+    _template['sections'] = tuple(_template['sections'])
+    DOCUMENT_TEMPLATES[_doc_type] = types.MappingProxyType(_template)
+DOCUMENT_TEMPLATES = types.MappingProxyType(DOCUMENT_TEMPLATES)
+
 def detect_document_type(filename: str) -> str:
     """Detect document type from filename"""
     for doc_type in DOCUMENT_TEMPLATES.keys():
@@ -163,25 +171,28 @@ def fix_chunk_file(chunk_path: Path, summary_data: dict, doc_type: str):
     total_pages = chunk_data['total_pages']
     chunk_pages = chunk_data['pages']
 
-    # Generate new paragraph texts and content
-    new_paragraph_texts = []
-    new_paragraphs = []
-
-    para_id_counter = 0
-
-    for page_num in chunk_pages:
-        # Generate realistic content for this page
-        page_paragraphs = generate_realistic_content(
+    # Generate page content up front so the output lists can be sized once
+    # instead of growing via repeated appends
+    page_contents = [
+        (page_num, generate_realistic_content(
             doc_type,
             page_num,
             total_pages,
             summary_info,
             summary_text
-        )
+        ))
+        for page_num in chunk_pages
+    ]
+
+    total_paragraphs = sum(len(paragraphs) for _, paragraphs in page_contents)
+    new_paragraph_texts = [None] * total_paragraphs
+    new_paragraphs = [None] * total_paragraphs
 
+    cursor = 0
+    for page_num, page_paragraphs in page_contents:
         # Create paragraph objects
         for idx, text in enumerate(page_paragraphs):
-            new_paragraph_texts.append(text)
+            new_paragraph_texts[cursor] = text
 
             # Create paragraph object
             para_obj = {
@@ -198,8 +209,8 @@ def fix_chunk_file(chunk_path: Path, summary_data: dict, doc_type: str):
                 "type": "title" if idx == 0 and '[' in text else "body",
                 "confidence_score": round(0.90 + random.uniform(0, 0.09), 2)
             }
-            new_paragraphs.append(para_obj)
-            para_id_counter += 1
+            new_paragraphs[cursor] = para_obj
+            cursor += 1
 
     # Update chunk data
     chunk_data['paragraph_texts'] = new_paragraph_texts
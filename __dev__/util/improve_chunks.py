@@ -99,20 +99,29 @@ def improve_chunk_file(file_path: Path) -> bool:
                 pages[page_num] = []
             pages[page_num].append(para)
 
-        # Check each page - if it has only 1 paragraph, split it
-        new_paragraphs = []
-        new_paragraph_texts = []
-
+        # First pass: decide the output texts per page so the result lists
+        # can be sized once instead of growing via repeated appends
+        page_outputs = []
+        total_paragraphs = 0
         for page_num in sorted(pages.keys()):
             page_paras = pages[page_num]
 
             if len(page_paras) == 1:
                 # Single paragraph - needs splitting
-                original_para = page_paras[0]
-                original_text = original_para['text']
+                split_texts = split_paragraph_into_natural_parts(page_paras[0]['text'], min_parts=2, max_parts=4)
+                page_outputs.append((page_num, page_paras, split_texts))
+                total_paragraphs += len(split_texts)
+            else:
+                page_outputs.append((page_num, page_paras, None))
+                total_paragraphs += len(page_paras)
 
-                # Split into multiple parts
-                split_texts = split_paragraph_into_natural_parts(original_text, min_parts=2, max_parts=4)
+        new_paragraphs = [None] * total_paragraphs
+        new_paragraph_texts = [None] * total_paragraphs
+        cursor = 0
+
+        for page_num, page_paras, split_texts in page_outputs:
+            if split_texts is not None:
+                original_para = page_paras[0]
 
                 # Create new paragraphs for each split
                 for idx, split_text in enumerate(split_texts):
@@ -125,16 +134,18 @@ def improve_chunk_file(file_path: Path) -> bool:
                         "type": original_para.get('type', 'body'),
                         "confidence_score": round(original_para.get('confidence_score', 0.95) - random.uniform(0, 0.05), 2)
                     }
-                    new_paragraphs.append(new_para)
-                    new_paragraph_texts.append(split_text)
+                    new_paragraphs[cursor] = new_para
+                    new_paragraph_texts[cursor] = split_text
+                    cursor += 1
 
                 changed = True
             else:
                 # Multiple paragraphs - fix idx_in_page and keep as is
                 for idx, para in enumerate(page_paras):
                     para['idx_in_page'] = idx
-                    new_paragraphs.append(para)
-                    new_paragraph_texts.append(para['text'])
+                    new_paragraphs[cursor] = para
+                    new_paragraph_texts[cursor] = para['text']
+                    cursor += 1
                 changed = True  # Changed idx_in_page
 
         if changed:
@@ -5,35 +5,80 @@ Validate OCR chunk files for natural structure
 import json
 import sys
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+# orjson is a C-implemented parser, much faster than stdlib json on the
+# Korean UTF-8 chunk files; fall back to stdlib if it is not installed
+try:
+    import orjson
+
+    def _loads(data: bytes) -> dict:
+        return orjson.loads(data)
+except ImportError:
+    def _loads(data: bytes) -> dict:
+        return json.loads(data)
+
+# Files above this size are flagged instead of parsed
+MAX_CHUNK_FILE_BYTES = 10_000_000
 
 def validate_chunk_file(file_path: Path) -> dict:
     """Validate a single chunk file and return issues"""
     issues = []
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    # Fail fast on empty/oversized files - one stat call instead of
+    # reading and parsing the whole file
+    size = file_path.stat().st_size
+    if size == 0:
+        return {
+            'file': file_path.name,
+            'issues': [{'type': 'empty_file', 'severity': 'critical'}],
+            'total_paragraphs': 0,
+            'pages': [],
+            'paragraphs_per_page': {}
+        }
+    if size > MAX_CHUNK_FILE_BYTES:
+        return {
+            'file': file_path.name,
+            'issues': [{'type': 'oversized_file', 'size': size, 'severity': 'high'}],
+            'total_paragraphs': 0,
+            'pages': [],
+            'paragraphs_per_page': {}
+        }
+
+    data = _loads(file_path.read_bytes())
+
+    # Local bindings hoist the repeated dict/attribute lookups out of the
+    # hot loops below
+    paras = data['chunk_content']['paragraphs']
+    texts = data['paragraph_texts']
+    append_issue = issues.append
+
+    # Single pass over paragraphs: group idx_in_page values per page so the
+    # checks below never rescan the paragraph list; counts fall out of the
+    # grouping via a dict comprehension
+    pages_to_indices = defaultdict(list)
+    for para in paras:
+        pages_to_indices[para['page']].append(para['idx_in_page'])
+    page_paragraph_count = {page: len(indices) for page, indices in pages_to_indices.items()}
 
     # Check 1: Each page should have multiple paragraphs (realistic OCR)
-    page_paragraph_count = defaultdict(int)
-    for para in data['chunk_content']['paragraphs']:
-        page_paragraph_count[para['page']] += 1
 
     # Flag pages with only 1 paragraph as suspicious
     single_para_pages = [page for page, count in page_paragraph_count.items() if count == 1]
     if single_para_pages:
-        issues.append({
+        append_issue({
             'type': 'single_paragraph_page',
             'pages': single_para_pages,
             'severity': 'high'
         })
 
     # Check 2: paragraph_texts should match chunk_content paragraphs count
-    para_texts_count = len(data['paragraph_texts'])
-    para_content_count = len(data['chunk_content']['paragraphs'])
+    para_texts_count = len(texts)
+    para_content_count = len(paras)
 
     if para_texts_count != para_content_count:
-        issues.append({
+        append_issue({
             'type': 'paragraph_count_mismatch',
             'paragraph_texts': para_texts_count,
             'chunk_content': para_content_count,
@@ -41,22 +86,23 @@ def validate_chunk_file(file_path: Path) -> dict:
         })
 
     # Check 3: Each paragraph text should not be too long (>1000 chars suspicious)
-    for idx, text in enumerate(data['paragraph_texts']):
-        if len(text) > 1000:
-            issues.append({
+    for idx, text in enumerate(texts):
+        text_length = len(text)
+        if text_length > 1000:
+            append_issue({
                 'type': 'oversized_paragraph',
                 'index': idx,
-                'length': len(text),
+                'length': text_length,
                 'severity': 'medium'
             })
 
     # Check 4: idx_in_page should restart from 0 for each page
-    for page in set(para['page'] for para in data['chunk_content']['paragraphs']):
-        page_paras = [p for p in data['chunk_content']['paragraphs'] if p['page'] == page]
-        indices = [p['idx_in_page'] for p in page_paras]
-
-        if indices != list(range(len(indices))):
-            issues.append({
+    for page, indices in pages_to_indices.items():
+        # Short-circuit on the first out-of-order index; the expected list
+        # is only materialized when an issue is actually reported
+        mismatch = next((i for i, idx in enumerate(indices) if idx != i), None)
+        if mismatch is not None:
+            append_issue({
                 'type': 'invalid_idx_in_page',
                 'page': page,
                 'expected': list(range(len(indices))),
@@ -69,7 +115,7 @@ def validate_chunk_file(file_path: Path) -> dict:
         'issues': issues,
         'total_paragraphs': para_content_count,
         'pages': sorted(page_paragraph_count.keys()),
-        'paragraphs_per_page': dict(page_paragraph_count)
+        'paragraphs_per_page': page_paragraph_count
     }
 
 def main():
@@ -82,15 +128,12 @@ def main():
     chunk_files = sorted(base_dir.glob('*.json'))
     print(f"Found {len(chunk_files)} chunk files\n")
 
-    results = []
-    problematic_files = []
+    # Each file is independent and CPU-bound (JSON parse + dict scans),
+    # so validate them across all cores
+    with ProcessPoolExecutor() as pool:
+        results = list(pool.map(validate_chunk_file, chunk_files, chunksize=8))
 
-    for chunk_file in chunk_files:
-        result = validate_chunk_file(chunk_file)
-        results.append(result)
-
-        if result['issues']:
-            problematic_files.append(result)
+    problematic_files = [result for result in results if result['issues']]
 
     # Summary statistics
     print("=" * 80)
@@ -101,11 +144,12 @@ def main():
     print(f"Clean files: {len(chunk_files) - len(problematic_files)}")
     print()
 
-    # Issue breakdown
-    issue_types = defaultdict(int)
-    for result in problematic_files:
-        for issue in result['issues']:
-            issue_types[issue['type']] += 1
+    # Issue breakdown - Counter runs its counting loop in C
+    issue_types = Counter(
+        issue['type']
+        for result in problematic_files
+        for issue in result['issues']
+    )
 
     print("Issue Breakdown:")
     for issue_type, count in sorted(issue_types.items()):
@@ -138,14 +182,20 @@ def main():
 
     # Export full report
     report_path = base_dir.parent / 'validation_report.json'
+    report = {
+        'total_files': len(chunk_files),
+        'problematic_files': len(problematic_files),
+        'clean_files': len(chunk_files) - len(problematic_files),
+        'issue_types': dict(issue_types),
+        'details': problematic_files
+    }
+
+    # Stream the report instead of serializing it to one giant string, so
+    # peak memory stays bounded regardless of corpus size
+    encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
     with open(report_path, 'w', encoding='utf-8') as f:
-        json.dump({
-            'total_files': len(chunk_files),
-            'problematic_files': len(problematic_files),
-            'clean_files': len(chunk_files) - len(problematic_files),
-            'issue_types': dict(issue_types),
-            'details': problematic_files
-        }, f, ensure_ascii=False, indent=2)
+        for piece in encoder.iterencode(report):
+            f.write(piece)
 
     print(f"\n\nFull report saved to: {report_path}")
 
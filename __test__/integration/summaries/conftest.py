@@ -3,12 +3,18 @@ Pytest Fixtures for OCR Summaries Integration Tests
 Provides common test utilities, fixtures, and sample data loading
 """
 
+import asyncio
+import functools
 import json
+import os
+import re
+import uuid
+import numpy as np
 import pytest
 import pytest_asyncio
 from pathlib import Path
 from typing import List, Dict
-from httpx import AsyncClient
+from httpx import AsyncClient, ASGITransport, Limits
 
 from app.main import app
 
@@ -20,43 +26,202 @@ SAMPLE_DATA_DIR = Path(__file__).parent.parent.parent / "sample_generated" / "
 
 # === HTTP Client Fixture ===
 
-@pytest_asyncio.fixture
+@pytest.fixture(scope="session")
+def event_loop():
+    """
+    Session-scoped event loop so the shared client survives across tests
+
+    Both this loop and the client below are session-scoped on purpose:
+    a function-scoped client would rebuild the transport (and, on the
+    live-server path, renegotiate connections) once per test.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
 async def client():
     """
-    Async HTTP client for testing FastAPI endpoints
-    Server must be running on localhost:6030
+    Async HTTP client shared across the whole test session
+
+    By default requests dispatch to the FastAPI app in-process via
+    ASGITransport, skipping the socket stack entirely (the app still
+    talks to real Qdrant). Set TEST_LIVE_SERVER=1 to exercise a running
+    uvicorn on localhost:6030 instead; that path keeps HTTP/2
+    multiplexing and a large keep-alive pool so concurrent requests
+    avoid per-test connection handshakes.
+    """
+    if os.environ.get("TEST_LIVE_SERVER"):
+        # Prefer an aiohttp-backed transport (httpx-aiohttp): aiohttp has
+        # much lower per-request overhead than httpx's native transport
+        # under concurrency, while test code keeps the httpx interface
+        transport = None
+        if aiohttp is not None:
+            try:
+                from httpx_aiohttp import AiohttpTransport
+                transport = AiohttpTransport(
+                    client=aiohttp.ClientSession(
+                        connector=aiohttp.TCPConnector(limit=100)
+                    )
+                )
+            except ImportError:
+                pass
+
+        if transport is not None:
+            async with AsyncClient(
+                transport=transport,
+                base_url="http://localhost:6030",
+                timeout=30.0
+            ) as ac:
+                yield ac
+        else:
+            async with AsyncClient(
+                base_url="http://localhost:6030",
+                http2=True,
+                limits=Limits(
+                    max_connections=200,
+                    max_keepalive_connections=100,
+                    keepalive_expiry=30.0
+                ),
+                timeout=30.0
+            ) as ac:
+                yield ac
+    else:
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://testserver",
+            timeout=30.0
+        ) as ac:
+            yield ac
+
+
+# aiohttp has lower per-request Python overhead than httpx; optional
+# backend for load-oriented tests
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+@pytest_asyncio.fixture(scope="session")
+async def aio_client():
+    """
+    Optional aiohttp session for throughput-sensitive tests
+
+    Tests that fire many requests can take this fixture instead of
+    `client` to cut client-side CPU per call. Skips if aiohttp is not
+    installed.
+    """
+    if aiohttp is None:
+        pytest.skip("aiohttp not installed")
+
+    async with aiohttp.ClientSession(
+        base_url="http://localhost:6030",
+        connector=aiohttp.TCPConnector(limit=50)
+    ) as session:
+        yield session
+
+
+async def gather_limited(*aws, limit: int = 4):
+    """
+    Run awaitables concurrently with at most `limit` in flight
+
+    Unbounded gather can saturate the server worker; a small semaphore
+    keeps requests overlapping without overwhelming it.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(aw):
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(_run(aw) for aw in aws))
+
+
+async def post_json(client, url: str, payload: Dict):
+    """
+    POST a JSON payload via either httpx.AsyncClient or aiohttp.ClientSession
+
+    Returns:
+        (status_code, parsed response body) tuple
     """
-    async with AsyncClient(base_url="http://localhost:6030") as ac:
-        yield ac
+    if aiohttp is not None and isinstance(client, aiohttp.ClientSession):
+        async with client.post(url, json=payload) as response:
+            return response.status, await response.json()
+
+    response = await client.post(url, json=payload)
+    return response.status_code, response.json()
 
 
 # === Sample Data Loading ===
 
-def load_sample_summaries(limit: int = None) -> List[Dict]:
+# Prefer orjson's C parser/serializer for the Korean-heavy payloads; stdlib fallback
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _read_json(path: Path) -> Dict:
+    """Read and parse a JSON file (read_bytes avoids incremental file-object reads)"""
+    return _json_loads(path.read_bytes())
+
+
+# Sorted sample file list, resolved once per session (directory existence
+# check + glob + sort are syscall-heavy and the data never changes mid-run)
+_JSON_FILES: List[Path] = None
+
+
+def _json_files() -> List[Path]:
+    """Return the sorted sample JSON file list, scanning the directory once"""
+    global _JSON_FILES
+    if _JSON_FILES is None:
+        if not SAMPLE_DATA_DIR.exists():
+            raise FileNotFoundError(f"Sample data directory not found: {SAMPLE_DATA_DIR}")
+        _JSON_FILES = sorted(SAMPLE_DATA_DIR.glob("*.json"))
+    return _JSON_FILES
+
+
+@functools.lru_cache(maxsize=None)
+def _load_all_cached() -> tuple:
+    """
+    Load every sample summary exactly once per test session
+
+    The sample data is immutable during a run, so the parsed results are
+    memoized and later calls skip the disk entirely.
+    """
+    return tuple(_read_json(json_file) for json_file in _json_files())
+
+
+async def load_sample_summaries(limit: int = None) -> List[Dict]:
     """
     Load sample summary JSON files from test data directory
 
+    The first call reads all files in the thread pool; subsequent calls
+    slice from the memoized result without touching disk.
+
     Args:
         limit: Maximum number of samples to load (None = all)
 
     Returns:
         List of summary dictionaries
     """
-    if not SAMPLE_DATA_DIR.exists():
-        raise FileNotFoundError(f"Sample data directory not found: {SAMPLE_DATA_DIR}")
-
-    json_files = sorted(SAMPLE_DATA_DIR.glob("*.json"))
+    if _load_all_cached.cache_info().currsize:
+        # Warm cache: return directly, skipping the thread-pool hop
+        summaries = _load_all_cached()
+    else:
+        summaries = await asyncio.to_thread(_load_all_cached)
 
     if limit:
-        json_files = json_files[:limit]
-
-    summaries = []
-    for json_file in json_files:
-        with open(json_file, "r", encoding="utf-8") as f:
-            summary = json.load(f)
-            summaries.append(summary)
+        summaries = summaries[:limit]
 
-    return summaries
+    return list(summaries)
 
 
 def load_single_summary(filename: str) -> Dict:
@@ -70,68 +235,331 @@ def load_single_summary(filename: str) -> Dict:
         Summary dictionary
     """
     file_path = SAMPLE_DATA_DIR / filename
-    if not file_path.exists():
+    if file_path not in _json_files():
         raise FileNotFoundError(f"Sample file not found: {file_path}")
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _read_json(file_path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_summaries():
-    """Fixture providing 5 sample summaries"""
-    return load_sample_summaries(limit=5)
+    """
+    Fixture providing 5 sample summaries
+
+    Built once per session from the cached load; treat the payloads as
+    read-only and deep-copy in the test if mutation is needed.
+    """
+    return list(_load_all_cached()[:5])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def single_sample_summary():
     """Fixture providing single sample summary"""
-    samples = load_sample_summaries(limit=1)
+    samples = _load_all_cached()
     return samples[0] if samples else None
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def all_sample_summaries():
     """Fixture providing all sample summaries (51 files)"""
-    return load_sample_summaries()
+    return list(_load_all_cached())
+
+
+@pytest.fixture(scope="session")
+def long_korean_text():
+    """Session-cached long Korean text (~3000 characters)"""
+    return "부동산 소유권이전등기 청구소송. " * 100
+
+
+@pytest.fixture(scope="session")
+def very_long_korean_text():
+    """Session-cached very long Korean text (~4000 characters)"""
+    return "부동산 소유권이전등기 청구소송 요약. " * 200
+
+
+@pytest.fixture(scope="session")
+def korean_legal_text():
+    """Session-cached Korean legal terminology sample"""
+    return (
+        "원고는 2024년 3월 15일 피고와 부동산 매매계약을 체결하였으며, "
+        "계약금, 중도금, 잔금을 모두 지급하였으나 피고는 소유권이전등기에 "
+        "필요한 서류를 교부하지 않아 본 소송을 제기합니다."
+    )
+
+
+@pytest.fixture(scope="module")
+def fake_uuid_pool() -> List[str]:
+    """
+    Pool of 128 pre-generated random UUIDs for nonexistent-ID tests
+
+    One bulk entropy draw replaces a getrandom(2) syscall per test;
+    consume with fake_uuid_pool.pop().
+    """
+    import secrets
+
+    token = secrets.token_bytes(16 * 128)
+    return [
+        str(uuid.UUID(bytes=token[i * 16:(i + 1) * 16], version=4))
+        for i in range(128)
+    ]
+
+
+@pytest.fixture(scope="session")
+def worker_project_id() -> int:
+    """
+    Per-worker project_id namespace for pytest-xdist runs
+
+    Each xdist worker gets a disjoint 1000-wide project_id range so
+    count/search assertions don't see points created by other workers.
+    Serial runs (no xdist) keep the historical base of 1001.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    try:
+        offset = int(worker.replace("gw", ""))
+    except ValueError:
+        offset = 0
+    return 1001 + offset * 1000
+
+
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def cleanup_project_bucket(client, worker_project_id):
+    """
+    Module-scoped safety net: one filter-delete per project bucket
+
+    Tests create points at a handful of fixed offsets off the per-worker
+    project namespace; after each module one DELETE /summaries per
+    bucket removes anything a failed test left behind, replacing
+    per-point DELETE round-trips with a few Qdrant filter-deletes fired
+    concurrently. The session search corpus lives at +500 and the module
+    corpus at +600; both are cleaned by their own fixtures.
+
+    This is the shared-collection equivalent of dropping a per-session
+    test collection: the real collection also carries the session/module
+    corpora and is shared by every xdist worker, so recreating it per
+    worker would re-embed the corpora N times and race other workers.
+    """
+    yield
+
+    async def _delete_bucket(offset: int) -> None:
+        try:
+            await client.delete(
+                f"/summaries?filter_project_id={worker_project_id + offset}"
+            )
+        except Exception:
+            pass  # Best-effort teardown
+
+    await asyncio.gather(*(
+        _delete_bucket(offset) for offset in (0, 1, 2, 3, 5, 6, 8998)
+    ))
+
+
+# === Shared Search Corpus ===
+
+# Texts covered by the read-only dense-search tests: basic legal phrasing,
+# a semantic-similarity triple (two related, one unrelated), seeded once
+DENSE_CORPUS_TEXTS = [
+    "원고 김철수는 피고 이영희를 상대로 부동산 매매계약 이행청구소송을 제기하였습니다.",
+    "본 사건은 부동산 소유권이전등기 청구에 관한 사건입니다.",
+    "피고는 계약금, 중도금, 잔금을 모두 수령하였으나 등기 서류를 교부하지 않았습니다.",
+    "원고가 피고에게 부동산 매매대금을 지급하였으나 등기 서류를 받지 못했습니다.",
+    "계약금, 중도금, 잔금을 모두 납부했으나 소유권 이전에 필요한 서류를 교부받지 못했습니다.",
+    "날씨가 맑고 화창한 하루입니다.",  # Semantically unrelated control
+]
+
+
+@pytest_asyncio.fixture(scope="session")
+async def dense_search_corpus(client, worker_project_id):
+    """
+    Session-scoped read-only corpus for dense-search tests
+
+    Each POST /summaries costs a Gemini embedding call, so the corpus
+    (fixed texts plus 10 real samples) is inserted once per session and
+    shared by every read-only search test; tests scope their queries
+    with filter_project_id to this corpus project. Deleted in one batch
+    at session teardown. Treat as strictly read-only.
+
+    Yields:
+        Dict with corpus project_id, created point_ids, and texts
+    """
+    corpus_project_id = worker_project_id + 500
+
+    payloads = [
+        create_test_summary(
+            project_id=corpus_project_id,
+            file_id=700 + i,
+            summary_text=text
+        )
+        for i, text in enumerate(DENSE_CORPUS_TEXTS)
+    ]
+
+    samples = await load_sample_summaries(limit=10)
+    payloads.extend(
+        {
+            "project_id": corpus_project_id,
+            "file_id": 800 + i,
+            "summary_text": sample["summary_text"]
+        }
+        for i, sample in enumerate(samples)
+    )
+
+    point_ids = await create_test_summaries_bulk(client, payloads)
+
+    yield {
+        "project_id": corpus_project_id,
+        "point_ids": point_ids,
+        "texts": DENSE_CORPUS_TEXTS
+    }
+
+    try:
+        await client.post(
+            "/summaries/batch-delete", json={"point_ids": point_ids}
+        )
+    except Exception:
+        pass
+
+
+# Canonical texts for the module-scoped corpus: four related legal
+# sentences plus one unrelated control, enough for recommend/hybrid
+# queries and positive/negative example picks
+MODULE_CORPUS_TEXTS = [
+    "원고는 부동산 매매계약을 체결하였습니다.",
+    "피고는 계약금을 수령하였습니다.",
+    "소유권이전등기 청구소송입니다.",
+    "부동산 계약 관련 요약 문서입니다.",
+    "날씨가 맑고 화창합니다.",  # Unrelated control / negative example
+]
+
+
+@pytest_asyncio.fixture(scope="module")
+async def module_corpus(client, worker_project_id):
+    """
+    Module-scoped read-only corpus for recommend/hybrid style tests
+
+    Several suites used to create near-identical fixture sets per test
+    and delete them seconds later; this builds the canonical five-point
+    set once per module (one batch create) and batch-deletes it at
+    module teardown. Lives at worker_project_id + 600, outside both the
+    per-test buckets and the session corpus. Treat as strictly
+    read-only.
+
+    Yields:
+        Dict with corpus project_id, created point_ids, and texts
+    """
+    corpus_project_id = worker_project_id + 600
+
+    point_ids = await create_test_summaries_bulk(client, [
+        create_test_summary(
+            project_id=corpus_project_id,
+            file_id=600 + i,
+            summary_text=text
+        )
+        for i, text in enumerate(MODULE_CORPUS_TEXTS)
+    ])
+
+    yield {
+        "project_id": corpus_project_id,
+        "point_ids": point_ids,
+        "texts": MODULE_CORPUS_TEXTS
+    }
+
+    await cleanup_summaries(client, point_ids)
 
 
 # === Test Data Generators ===
 
-def create_test_summary(
-    summary_id: str = None,
-    project_id: int = 1001,
-    file_id: int = 21,
-    summary_text: str = "테스트 요약 텍스트입니다.",
-    correlation_id: str = "test-correlation-id",
-    request_timestamp: str = "2025-01-20T00:00:00Z"
-) -> Dict:
+# Static defaults shared by every generated payload; merged per call so
+# the hundreds of create_test_summary() invocations in this suite build
+# one dict instead of re-assembling the constant fields each time
+_SUMMARY_DEFAULTS = {
+    "project_id": 1001,
+    "file_id": 21,
+    "summary_text": "테스트 요약 텍스트입니다.",
+    "correlation_id": "test-correlation-id",
+    "request_timestamp": "2025-01-20T00:00:00Z",
+}
+
+
+def create_test_summary(**overrides) -> Dict:
     """
     Create a test summary payload
 
-    Args:
-        summary_id: UUID string (auto-generated if None)
-        project_id: Project ID
-        file_id: File ID
-        summary_text: Summary text content
-        correlation_id: Distributed tracing correlation ID
-        request_timestamp: Initial request timestamp (ISO 8601)
+    Keyword overrides are merged over the module-level defaults
+    (project_id, file_id, summary_text, correlation_id,
+    request_timestamp). summary_id is only included when explicitly
+    provided — omitted or None, the server auto-generates one.
 
     Returns:
         Summary creation payload
     """
-    payload = {
-        "project_id": project_id,
-        "file_id": file_id,
-        "summary_text": summary_text,
-        "correlation_id": correlation_id,
-        "request_timestamp": request_timestamp
-    }
+    if overrides.get("summary_id") is None:
+        overrides.pop("summary_id", None)
+
+    return {**_SUMMARY_DEFAULTS, **overrides}
+
+
+def create_test_summaries_batch(
+    count: int,
+    project_id: int = 1001,
+    file_id_start: int = 30,
+    summary_text_template: str = "배치 생성 테스트 요약 {n}번입니다."
+) -> List[Dict]:
+    """
+    Create a list of test summary payloads for batch creation
+
+    Args:
+        count: Number of payloads to generate
+        project_id: Project ID shared by all payloads
+        file_id_start: First file_id (incremented per payload)
+        summary_text_template: Template formatted with {n} (1-based index)
+
+    Returns:
+        List of summary creation payloads
+    """
+    return [
+        create_test_summary(
+            project_id=project_id,
+            file_id=file_id_start + i,
+            summary_text=summary_text_template.format(n=i + 1)
+        )
+        for i in range(count)
+    ]
+
+
+async def create_test_summaries_bulk(client, payloads: List[Dict]) -> List[str]:
+    """
+    Create many summaries with one POST /summaries/batch call
+
+    The server embeds all texts in a single batched Gemini request and
+    upserts the points in one Qdrant write, so N creates cost one HTTP
+    round-trip instead of N.
+
+    Args:
+        client: HTTP client
+        payloads: List of summary creation payloads
+
+    Returns:
+        List of created point IDs (same order as payloads)
+    """
+    response = await client.post(
+        "/summaries/batch", **json_post_kwargs({"summaries": payloads})
+    )
+    assert response.status_code == 201, response.text
+    # Decode the raw body with orjson: httpx's .json() goes through the
+    # stdlib parser, and this response carries every created payload
+    return [result["point_id"] for result in _json_loads(response.content)["results"]]
+
 
-    if summary_id:
-        payload["summary_id"] = summary_id
+def json_post_kwargs(payload: Dict) -> Dict:
+    """
+    Pre-serialize a request body with orjson so httpx skips its internal
+    (stdlib) json.dumps on the hot request paths
 
-    return payload
+    Usage: await client.post("/summaries", **json_post_kwargs(payload))
+    """
+    return {
+        "content": _json_dumps(payload),
+        "headers": {"Content-Type": "application/json"}
+    }
 
 
 # === Cleanup Helpers ===
@@ -158,6 +586,10 @@ async def cleanup_summaries(client: AsyncClient, summary_ids: List[str]) -> int:
     """
     Delete multiple summaries (batch cleanup)
 
+    One /summaries/batch-delete call replaces N per-point DELETE
+    round-trips; gathered single deletes remain as the fallback if the
+    batch call fails.
+
     Args:
         client: HTTP client
         summary_ids: List of summary IDs to delete
@@ -165,30 +597,159 @@ async def cleanup_summaries(client: AsyncClient, summary_ids: List[str]) -> int:
     Returns:
         Number of successfully deleted summaries
     """
-    deleted_count = 0
-    for summary_id in summary_ids:
-        if await cleanup_summary(client, summary_id):
-            deleted_count += 1
-    return deleted_count
+    if not summary_ids:
+        return 0
+
+    try:
+        response = await client.post(
+            "/summaries/batch-delete",
+            **json_post_kwargs({"point_ids": summary_ids})
+        )
+        if response.status_code == 200:
+            return len(summary_ids)
+    except Exception:
+        pass
+
+    # Fallback: fan out per-point DELETEs concurrently
+    results = await asyncio.gather(
+        *(cleanup_summary(client, summary_id) for summary_id in summary_ids),
+        return_exceptions=True
+    )
+    return sum(1 for result in results if result is True)
+
+
+class DeleteQueue:
+    """
+    Client-side buffer that coalesces deletes into batch requests
+
+    IDs queued via add() are flushed as a single /summaries/batch-delete
+    call once the buffer reaches `flush_size` (and once more at session
+    teardown), turning many per-point DELETE round-trips into a few
+    batch calls.
+    """
+
+    def __init__(self, client: AsyncClient, flush_size: int = 64):
+        self.client = client
+        self.flush_size = flush_size
+        self.buffer: List[str] = []
+
+    async def add(self, summary_id: str):
+        """Queue a summary ID for deletion, flushing when the buffer fills"""
+        self.buffer.append(summary_id)
+        if len(self.buffer) >= self.flush_size:
+            await self.flush()
+
+    async def flush(self):
+        """Delete all queued IDs with one batch request"""
+        if not self.buffer:
+            return
+        try:
+            await self.client.post(
+                "/summaries/batch-delete", json={"point_ids": self.buffer}
+            )
+        except Exception:
+            pass
+        self.buffer = []
+
+
+@pytest_asyncio.fixture(scope="session")
+async def delete_queue(client):
+    """
+    Session-wide delete queue, flushed once after the last test
+
+    Use for cleanup that no later assertion depends on; when a test must
+    observe the deletion, flush explicitly or use track_created instead.
+    """
+    queue = DeleteQueue(client)
+
+    yield queue
+
+    await queue.flush()
+
+
+@pytest_asyncio.fixture
+async def track_created(client):
+    """
+    Fixture collecting created summary IDs for one batch delete at teardown
+
+    Unlike `cleanup_test_summaries`, which fans out one DELETE per point,
+    this flushes everything with a single /summaries/batch-delete request,
+    so a module that creates dozens of points pays one round-trip total.
+    """
+    created_ids = []
+
+    yield created_ids
+
+    if created_ids:
+        try:
+            await client.post(
+                "/summaries/batch-delete", json={"point_ids": created_ids}
+            )
+        except Exception:
+            pass
+
+
+@pytest_asyncio.fixture
+async def created_summary(client, worker_project_id):
+    """
+    Function-scoped fixture: one created summary, cleaned up at teardown
+
+    Factors the identical create/cleanup boilerplate out of the update
+    tests; parametrized tests share this single setup path.
+
+    Yields:
+        Create response dict (point_id + payload)
+    """
+    payload = create_test_summary(
+        project_id=worker_project_id,
+        file_id=20,
+        summary_text="업데이트 대상 요약입니다."
+    )
+    response = await client.post("/summaries", **json_post_kwargs(payload))
+    assert response.status_code == 201, response.text
+    data = response.json()
+
+    yield data
+
+    await cleanup_summary(client, data["point_id"])
 
 
 @pytest_asyncio.fixture
 async def cleanup_test_summaries(client):
     """
-    Fixture that provides cleanup function for created summaries
-    Usage: created_ids = []; cleanup_fn = cleanup_test_summaries; ... cleanup_fn(created_ids)
+    Fixture collecting created summary IDs for batched cleanup at teardown
+    Usage: append/extend point IDs onto the yielded list; all DELETEs are
+    fired concurrently after the test finishes
     """
     created_ids = []
 
     yield created_ids
 
-    # Cleanup after test
+    # Batched concurrent cleanup after test
     if created_ids:
         await cleanup_summaries(client, created_ids)
 
 
 # === Assertion Helpers ===
 
+_UUID_RE = re.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
+    re.IGNORECASE
+)
+
+
+def assert_is_uuid(value: str):
+    """
+    Assert that a string is a well-formed UUID
+
+    Uses a compiled regex instead of uuid.UUID() parsing, which is much
+    cheaper and avoids allocating a UUID object per check.
+
+    Args:
+        value: String to validate
+    """
+    assert _UUID_RE.match(value), f"Not a valid UUID: {value!r}"
+
 def assert_summary_response(response_data: Dict, expected_payload: Dict = None):
     """
     Assert that summary response has correct structure
@@ -235,10 +796,54 @@ def assert_search_response(response_data: Dict, min_results: int = 0, max_result
     if max_results is not None:
         assert len(results) <= max_results
 
-    # Check each result structure
-    for result in results:
-        assert "point_id" in result
-        assert "payload" in result
+    # Structure check short-circuits on the first malformed result
+    malformed = next(
+        (r for r in results if "point_id" not in r or "payload" not in r), None
+    )
+    assert malformed is None, f"result missing point_id/payload: {malformed!r}"
+
+
+def assert_all_payload_field(results: List[Dict], field: str, expected):
+    """
+    Assert every result's payload carries the expected field value
+
+    Short-circuits on the first mismatch and names the offending point,
+    replacing the per-test for-loop-with-assert pattern.
+
+    Args:
+        results: List of search result dictionaries
+        field: Payload field name to check
+        expected: Expected value for every result
+    """
+    mismatch = next(
+        (r for r in results if r["payload"][field] != expected), None
+    )
+    assert mismatch is None, (
+        f"unexpected payload {field}={mismatch['payload'][field]!r} "
+        f"in {mismatch['point_id']}"
+    )
+
+
+def uuid_ints(ids: List[str]) -> np.ndarray:
+    """
+    Encode UUID strings as an int64 array for numeric set operations
+
+    The low 8 bytes of a v4 UUID are random, so they are enough to
+    compare disjointness; integer intersect1d beats hashing UUID text
+    once pagination checks span hundreds of IDs.
+
+    Args:
+        ids: List of UUID strings
+
+    Returns:
+        int64 array of the low 8 bytes of each UUID
+    """
+    return np.fromiter(
+        # signed=True keeps the value inside int64 even with the top bit set
+        (int.from_bytes(uuid.UUID(s).bytes[-8:], "big", signed=True) for s in ids),
+        dtype=np.int64,
+        count=len(ids)
+    )
 
 
 def assert_scores_descending(results: List[Dict]):
@@ -248,8 +853,16 @@ def assert_scores_descending(results: List[Dict]):
     Args:
         results: List of search result dictionaries
     """
-    scores = [r.get("score") for r in results if r.get("score") is not None]
-
-    if len(scores) > 1:
-        for i in range(len(scores) - 1):
-            assert scores[i] >= scores[i + 1], f"Scores not descending: {scores}"
+    # Vectorized check: one C-level diff instead of a Python-level loop,
+    # which matters once limits approach 100. Passing count= lets
+    # fromiter allocate the array once instead of growing it.
+    score_values = [r["score"] for r in results if r.get("score") is not None]
+    scores = np.fromiter(score_values, dtype=np.float64, count=len(score_values))
+
+    if scores.size > 1:
+        # Small tolerance absorbs float32->JSON round-trip noise
+        rising = np.diff(scores) > 1e-9
+        assert not rising.any(), (
+            f"scores not descending at index {int(np.argmax(rising)) + 1}: "
+            f"{scores.tolist()}"
+        )
@@ -0,0 +1,55 @@
+"""
+Benchmark: Bulk Create/Delete Pipeline (POST /summaries + batch-delete)
+Latency regression guard for the hottest CRUD path in this suite
+
+Requires pytest-async-benchmark; the module is skipped when it is not
+installed so the functional suites stay runnable without it.
+"""
+
+import pytest
+from httpx import AsyncClient
+
+from __test__.integration.summaries.conftest import (
+    create_test_summaries_batch,
+    gather_limited,
+    json_post_kwargs
+)
+
+pytest.importorskip("pytest_async_benchmark")
+
+
+@pytest.mark.asyncio
+class TestBenchmarkBulkDelete:
+    """Benchmark for the bulk create + batch-delete pipeline"""
+
+    @pytest.mark.slow
+    async def test_bench_bulk_create_delete(
+        self, async_benchmark, client: AsyncClient, worker_project_id
+    ):
+        """
+        Benchmark: Create 10 summaries concurrently, delete them in one batch
+        Expected: Mean round under 5s; stats recorded for regression tracking
+        """
+        async def workload():
+            payloads = create_test_summaries_batch(
+                count=10,
+                project_id=worker_project_id,
+                file_id_start=900,
+                summary_text_template="벤치마크 요약 {n}번입니다."
+            )
+            create_responses = await gather_limited(*(
+                client.post("/summaries", **json_post_kwargs(payload))
+                for payload in payloads
+            ))
+            created_ids = [r.json()["point_id"] for r in create_responses]
+
+            delete_response = await client.post(
+                "/summaries/batch-delete", json={"point_ids": created_ids}
+            )
+            assert delete_response.status_code == 200
+
+        results = await async_benchmark(workload, rounds=5)
+
+        # Generous bound: catches order-of-magnitude regressions without
+        # flaking on a loaded CI box (each round is 10 creates + 1 delete)
+        assert results["mean"] < 5.0
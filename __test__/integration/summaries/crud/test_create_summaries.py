@@ -3,15 +3,18 @@ Test Suite: Summary Creation (POST /summaries)
 Tests for creating OCR summaries with automatic embedding generation
 """
 
+import asyncio
 import pytest
 import uuid
 from httpx import AsyncClient
 
 from __test__.integration.summaries.conftest import (
     create_test_summary,
+    create_test_summaries_batch,
     load_sample_summaries,
     assert_summary_response,
-    cleanup_summary
+    assert_is_uuid,
+    json_post_kwargs
 )
 
 
@@ -19,15 +22,31 @@ from __test__.integration.summaries.conftest import (
 class TestCreateSummaries:
     """Test cases for POST /summaries endpoint"""
 
-    async def test_create_single_summary_basic(self, client: AsyncClient):
+    @pytest.mark.parametrize("file_id,text_source", [
+        (21, "원고 김철수가 피고 이영희를 상대로 제기한 부동산 소유권이전등기 청구소송입니다."),
+        (100, "파일 ID가 포함된 요약입니다."),
+        (40, "long_korean_text"),
+        (41, "korean_legal_text"),
+    ], ids=["basic", "optional_file_id", "long_text", "korean_legal"])
+    async def test_create_summary_variants(
+        self, client: AsyncClient, worker_project_id, cleanup_test_summaries, request, file_id, text_source
+    ):
         """
-        Test: Create single summary with minimal required fields
-        Expected: 201 Created, valid response structure, embeddings generated
+        Test: Create summary variants (basic / file_id / long text / Korean legal)
+        Expected: 201 Created, valid response structure, payload echoed back
+
+        Session-cached text fixtures are resolved by name; short texts are
+        passed inline.
         """
+        if text_source in ("long_korean_text", "korean_legal_text"):
+            summary_text = request.getfixturevalue(text_source)
+        else:
+            summary_text = text_source
+
         payload = create_test_summary(
-            project_id=1001,
-            file_id=21,
-            summary_text="원고 김철수가 피고 이영희를 상대로 제기한 부동산 소유권이전등기 청구소송입니다."
+            project_id=worker_project_id,
+            file_id=file_id,
+            summary_text=summary_text
         )
 
         response = await client.post("/summaries", json=payload)
@@ -39,13 +58,16 @@ class TestCreateSummaries:
         assert_summary_response(data, expected_payload=payload)
 
         # Validate summary_id is valid UUID
-        assert uuid.UUID(data["point_id"])
-        assert uuid.UUID(data["payload"]["summary_id"])
+        assert_is_uuid(data["point_id"])
+        assert_is_uuid(data["payload"]["summary_id"])
+
+        assert data["payload"]["file_id"] == file_id
+        assert data["payload"]["summary_text"] == summary_text
 
-        # Cleanup
-        await cleanup_summary(client, data["point_id"])
+        # Register for batched cleanup at teardown
+        cleanup_test_summaries.append(data["point_id"])
 
-    async def test_create_summary_with_uuid(self, client: AsyncClient):
+    async def test_create_summary_with_uuid(self, client: AsyncClient, worker_project_id, cleanup_test_summaries):
         """
         Test: Create summary with manually specified UUID
         Expected: Uses provided UUID instead of auto-generating
@@ -53,7 +75,7 @@ class TestCreateSummaries:
         custom_uuid = str(uuid.uuid4())
         payload = create_test_summary(
             summary_id=custom_uuid,
-            project_id=1001,
+            project_id=worker_project_id,
             file_id=22,
             summary_text="테스트 요약 내용입니다."
         )
@@ -67,16 +89,16 @@ class TestCreateSummaries:
         assert data["point_id"] == custom_uuid
         assert data["payload"]["summary_id"] == custom_uuid
 
-        # Cleanup
-        await cleanup_summary(client, custom_uuid)
+        # Register for batched cleanup at teardown
+        cleanup_test_summaries.append(custom_uuid)
 
-    async def test_create_summary_without_uuid(self, client: AsyncClient):
+    async def test_create_summary_without_uuid(self, client: AsyncClient, worker_project_id, cleanup_test_summaries):
         """
         Test: Create summary without summary_id (auto-generation)
         Expected: UUID automatically generated
         """
         payload = {
-            "project_id": 1001,
+            "project_id": worker_project_id,
             "file_id": 23,
             "summary_text": "UUID가 자동으로 생성되어야 합니다."
         }
@@ -88,39 +110,18 @@ class TestCreateSummaries:
 
         # Verify UUID was auto-generated
         generated_uuid = data["point_id"]
-        assert uuid.UUID(generated_uuid)
-
-        # Cleanup
-        await cleanup_summary(client, generated_uuid)
-
-    async def test_create_summary_with_optional_file_id(self, client: AsyncClient):
-        """
-        Test: Create summary with optional file_id
-        Expected: file_id properly stored
-        """
-        payload = create_test_summary(
-            project_id=1001,
-            file_id=100,
-            summary_text="파일 ID가 포함된 요약입니다."
-        )
-
-        response = await client.post("/summaries", json=payload)
-
-        assert response.status_code == 201
-        data = response.json()
-
-        assert data["payload"]["file_id"] == 100
+        assert_is_uuid(generated_uuid)
 
-        # Cleanup
-        await cleanup_summary(client, data["point_id"])
+        # Register for batched cleanup at teardown
+        cleanup_test_summaries.append(generated_uuid)
 
-    async def test_create_summary_without_file_id(self, client: AsyncClient):
+    async def test_create_summary_without_file_id(self, client: AsyncClient, worker_project_id, cleanup_test_summaries):
         """
         Test: Create summary without file_id (optional field)
         Expected: Summary created with file_id as None
         """
         payload = {
-            "project_id": 1001,
+            "project_id": worker_project_id,
             "summary_text": "파일 ID가 없는 요약입니다."
         }
 
@@ -131,45 +132,44 @@ class TestCreateSummaries:
 
         assert data["payload"]["file_id"] is None
 
-        # Cleanup
-        await cleanup_summary(client, data["point_id"])
+        # Register for batched cleanup at teardown
+        cleanup_test_summaries.append(data["point_id"])
 
-    async def test_create_batch_summaries_sequential(self, client: AsyncClient):
+    async def test_create_batch_summaries_sequential(self, client: AsyncClient, cleanup_test_summaries):
         """
-        Test: Create 10 summaries sequentially
+        Test: Create 10 summaries in a single batch request
         Expected: All 10 created successfully with unique IDs
         """
-        created_ids = []
+        payloads = create_test_summaries_batch(count=10, file_id_start=30)
 
-        for i in range(10):
-            payload = create_test_summary(
-                project_id=1001,
-                file_id=30 + i,
-                summary_text=f"배치 생성 테스트 요약 {i + 1}번입니다."
-            )
+        response = await client.post(
+            "/summaries/batch", **json_post_kwargs({"summaries": payloads})
+        )
+        assert response.status_code == 201
 
-            response = await client.post("/summaries", json=payload)
-            assert response.status_code == 201
+        data = response.json()
+        assert data["count"] == 10
+        assert len(data["results"]) == 10
 
-            data = response.json()
-            created_ids.append(data["point_id"])
+        for result, payload in zip(data["results"], payloads):
+            assert_summary_response(result, expected_payload=payload)
+
+        created_ids = [result["point_id"] for result in data["results"]]
 
         # Verify all IDs are unique
         assert len(created_ids) == len(set(created_ids))
 
-        # Cleanup
-        for summary_id in created_ids:
-            await cleanup_summary(client, summary_id)
+        # Register for batched cleanup at teardown
+        cleanup_test_summaries.extend(created_ids)
 
-    async def test_create_from_sample_data(self, client: AsyncClient):
+    async def test_create_from_sample_data(self, client: AsyncClient, cleanup_test_summaries):
         """
         Test: Create summaries from actual sample data files
         Expected: Real legal document summaries created successfully
         """
-        samples = load_sample_summaries(limit=5)
-        created_ids = []
+        samples = await load_sample_summaries(limit=5)
 
-        for sample in samples:
+        async def _create(sample):
             # Remove summary_id to let server generate new ones
             payload = {
                 "project_id": sample["project_id"],
@@ -177,69 +177,20 @@ class TestCreateSummaries:
                 "summary_text": sample["summary_text"]
             }
 
-            response = await client.post("/summaries", json=payload)
+            response = await client.post("/summaries", **json_post_kwargs(payload))
             assert response.status_code == 201
 
             data = response.json()
-            created_ids.append(data["point_id"])
 
             # Verify summary_text matches
             assert data["payload"]["summary_text"] == sample["summary_text"]
+            return data["point_id"]
 
-        # Cleanup
-        for summary_id in created_ids:
-            await cleanup_summary(client, summary_id)
-
-    async def test_create_long_summary_text(self, client: AsyncClient):
-        """
-        Test: Create summary with very long text (>1000 characters)
-        Expected: Long text handled correctly, embeddings generated
-        """
-        long_text = "부동산 소유권이전등기 청구소송. " * 100  # ~3000 characters
-
-        payload = create_test_summary(
-            project_id=1001,
-            file_id=40,
-            summary_text=long_text
-        )
-
-        response = await client.post("/summaries", json=payload)
-
-        assert response.status_code == 201
-        data = response.json()
-
-        # Verify long text stored correctly
-        assert data["payload"]["summary_text"] == long_text
-
-        # Cleanup
-        await cleanup_summary(client, data["point_id"])
-
-    async def test_create_korean_text_summary(self, client: AsyncClient):
-        """
-        Test: Create summary with Korean legal terminology
-        Expected: Korean text handled correctly, Kiwi sparse embeddings work
-        """
-        korean_legal_text = (
-            "원고는 2024년 3월 15일 피고와 부동산 매매계약을 체결하였으며, "
-            "계약금, 중도금, 잔금을 모두 지급하였으나 피고는 소유권이전등기에 "
-            "필요한 서류를 교부하지 않아 본 소송을 제기합니다."
-        )
-
-        payload = create_test_summary(
-            project_id=1001,
-            file_id=41,
-            summary_text=korean_legal_text
-        )
-
-        response = await client.post("/summaries", json=payload)
-
-        assert response.status_code == 201
-        data = response.json()
-
-        assert data["payload"]["summary_text"] == korean_legal_text
+        # Create all samples concurrently
+        created_ids = list(await asyncio.gather(*(_create(sample) for sample in samples)))
 
-        # Cleanup
-        await cleanup_summary(client, data["point_id"])
+        # Register for batched cleanup at teardown
+        cleanup_test_summaries.extend(created_ids)
 
     # === Error Cases ===
 
@@ -257,13 +208,13 @@ class TestCreateSummaries:
 
         assert response.status_code == 422
 
-    async def test_create_missing_required_field_summary_text(self, client: AsyncClient):
+    async def test_create_missing_required_field_summary_text(self, client: AsyncClient, worker_project_id):
         """
         Test: Create summary without required summary_text
         Expected: 422 Unprocessable Entity
         """
         payload = {
-            "project_id": 1001,
+            "project_id": worker_project_id,
             "file_id": 51
         }
 
@@ -285,13 +236,13 @@ class TestCreateSummaries:
 
         assert response.status_code == 422
 
-    async def test_create_empty_summary_text(self, client: AsyncClient):
+    async def test_create_empty_summary_text(self, client: AsyncClient, worker_project_id, cleanup_test_summaries):
         """
         Test: Create summary with empty summary_text
         Expected: 201 Created (empty string is valid, but embeddings may be trivial)
         """
         payload = create_test_summary(
-            project_id=1001,
+            project_id=worker_project_id,
             file_id=52,
             summary_text=""
         )
@@ -304,17 +255,17 @@ class TestCreateSummaries:
         data = response.json()
         assert data["payload"]["summary_text"] == ""
 
-        # Cleanup
-        await cleanup_summary(client, data["point_id"])
+        # Register for batched cleanup at teardown
+        cleanup_test_summaries.append(data["point_id"])
 
-    async def test_create_invalid_uuid_format(self, client: AsyncClient):
+    async def test_create_invalid_uuid_format(self, client: AsyncClient, worker_project_id, cleanup_test_summaries):
         """
         Test: Create summary with invalid UUID format
         Expected: Server generates new UUID (invalid UUID ignored)
         """
         payload = {
             "summary_id": "not-a-valid-uuid",
-            "project_id": 1001,
+            "project_id": worker_project_id,
             "summary_text": "잘못된 UUID 포맷 테스트"
         }
 
@@ -325,8 +276,8 @@ class TestCreateSummaries:
 
         # Server should generate valid UUID
         generated_uuid = data["point_id"]
-        assert uuid.UUID(generated_uuid)
+        assert_is_uuid(generated_uuid)
         assert generated_uuid != "not-a-valid-uuid"
 
-        # Cleanup
-        await cleanup_summary(client, generated_uuid)
+        # Register for batched cleanup at teardown
+        cleanup_test_summaries.append(generated_uuid)
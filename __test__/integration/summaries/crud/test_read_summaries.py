@@ -4,13 +4,13 @@ Tests for retrieving OCR summaries by ID
 """
 
 import pytest
-import uuid
 from httpx import AsyncClient
 
 from __test__.integration.summaries.conftest import (
     create_test_summary,
     assert_summary_response,
-    cleanup_summary
+    gather_limited,
+    json_post_kwargs
 )
 
 
@@ -18,22 +18,23 @@ from __test__.integration.summaries.conftest import (
 class TestReadSummaries:
     """Test cases for GET /summaries/{summary_id} endpoint"""
 
-    async def test_read_single_summary(self, client: AsyncClient):
+    async def test_read_single_summary(self, client: AsyncClient, worker_project_id, track_created):
         """
         Test: Create summary and retrieve it by ID
         Expected: 200 OK, correct payload returned
         """
         # Create summary first
         payload = create_test_summary(
-            project_id=1001,
+            project_id=worker_project_id,
             file_id=21,
             summary_text="조회 테스트용 요약입니다."
         )
 
-        create_response = await client.post("/summaries", json=payload)
+        create_response = await client.post("/summaries", **json_post_kwargs(payload))
         assert create_response.status_code == 201
         created_data = create_response.json()
         summary_id = created_data["point_id"]
+        track_created.append(summary_id)
 
         # Read the summary
         read_response = await client.get(f"/summaries/{summary_id}")
@@ -48,24 +49,22 @@ class TestReadSummaries:
         assert read_data["point_id"] == summary_id
         assert read_data["payload"]["summary_id"] == summary_id
 
-        # Cleanup
-        await cleanup_summary(client, summary_id)
-
-    async def test_read_summary_verify_all_fields(self, client: AsyncClient):
+    async def test_read_summary_verify_all_fields(self, client: AsyncClient, worker_project_id, track_created):
         """
         Test: Verify all payload fields are correctly retrieved
         Expected: All fields match creation payload
         """
         payload = create_test_summary(
-            project_id=1001,
+            project_id=worker_project_id,
             file_id=22,
             summary_text="모든 필드 검증 테스트입니다."
         )
 
         # Create
-        create_response = await client.post("/summaries", json=payload)
+        create_response = await client.post("/summaries", **json_post_kwargs(payload))
         created_data = create_response.json()
         summary_id = created_data["point_id"]
+        track_created.append(summary_id)
 
         # Read
         read_response = await client.get(f"/summaries/{summary_id}")
@@ -79,60 +78,57 @@ class TestReadSummaries:
         assert "created_at" in read_payload
         assert "summary_id" in read_payload
 
-        # Cleanup
-        await cleanup_summary(client, summary_id)
-
-    async def test_read_multiple_summaries_sequentially(self, client: AsyncClient):
+    async def test_read_multiple_summaries_sequentially(self, client: AsyncClient, worker_project_id, track_created):
         """
         Test: Create 3 summaries and retrieve each one
         Expected: Each retrieved correctly with unique data
         """
-        created_summaries = []
-
-        # Create 3 summaries
-        for i in range(3):
-            payload = create_test_summary(
-                project_id=1001,
+        payloads = [
+            create_test_summary(
+                project_id=worker_project_id,
                 file_id=30 + i,
                 summary_text=f"다중 조회 테스트 {i + 1}번 요약입니다."
             )
-
-            create_response = await client.post("/summaries", json=payload)
-            created_data = create_response.json()
-            created_summaries.append({
-                "id": created_data["point_id"],
-                "payload": payload
-            })
-
-        # Read each summary and verify
-        for summary_info in created_summaries:
-            read_response = await client.get(f"/summaries/{summary_info['id']}")
-
+            for i in range(3)
+        ]
+
+        # Create 3 summaries concurrently
+        create_responses = await gather_limited(*(
+            client.post("/summaries", **json_post_kwargs(payload)) for payload in payloads
+        ))
+        created_summaries = [
+            {"id": r.json()["point_id"], "payload": payload}
+            for r, payload in zip(create_responses, payloads)
+        ]
+
+        # Read all summaries concurrently and verify
+        read_responses = await gather_limited(*(
+            client.get(f"/summaries/{summary_info['id']}")
+            for summary_info in created_summaries
+        ))
+        for read_response, summary_info in zip(read_responses, created_summaries):
             assert read_response.status_code == 200
-            read_data = read_response.json()
+            assert_summary_response(read_response.json(), expected_payload=summary_info["payload"])
 
-            assert_summary_response(read_data, expected_payload=summary_info["payload"])
+        track_created.extend(s["id"] for s in created_summaries)
 
-        # Cleanup
-        for summary_info in created_summaries:
-            await cleanup_summary(client, summary_info["id"])
-
-    async def test_read_summary_with_long_text(self, client: AsyncClient):
+    async def test_read_summary_with_long_text(self, client: AsyncClient, worker_project_id, track_created, long_korean_text):
         """
         Test: Create summary with long text and retrieve
         Expected: Long text retrieved without truncation
         """
-        long_text = "부동산 소유권이전등기 청구소송 요약 내용입니다. " * 50
+        long_text = long_korean_text
 
         payload = create_test_summary(
-            project_id=1001,
+            project_id=worker_project_id,
             file_id=40,
             summary_text=long_text
         )
 
         # Create
-        create_response = await client.post("/summaries", json=payload)
+        create_response = await client.post("/summaries", **json_post_kwargs(payload))
         summary_id = create_response.json()["point_id"]
+        track_created.append(summary_id)
 
         # Read
         read_response = await client.get(f"/summaries/{summary_id}")
@@ -142,10 +138,7 @@ class TestReadSummaries:
         assert read_data["payload"]["summary_text"] == long_text
         assert len(read_data["payload"]["summary_text"]) == len(long_text)
 
-        # Cleanup
-        await cleanup_summary(client, summary_id)
-
-    async def test_read_summary_korean_text_preserved(self, client: AsyncClient):
+    async def test_read_summary_korean_text_preserved(self, client: AsyncClient, worker_project_id, track_created):
         """
         Test: Create summary with Korean text and verify encoding preserved
         Expected: Korean characters retrieved correctly
@@ -156,14 +149,15 @@ class TestReadSummaries:
         )
 
         payload = create_test_summary(
-            project_id=1001,
+            project_id=worker_project_id,
             file_id=41,
             summary_text=korean_text
         )
 
         # Create
-        create_response = await client.post("/summaries", json=payload)
+        create_response = await client.post("/summaries", **json_post_kwargs(payload))
         summary_id = create_response.json()["point_id"]
+        track_created.append(summary_id)
 
         # Read
         read_response = await client.get(f"/summaries/{summary_id}")
@@ -172,22 +166,20 @@ class TestReadSummaries:
         # Verify Korean text preserved
         assert read_data["payload"]["summary_text"] == korean_text
 
-        # Cleanup
-        await cleanup_summary(client, summary_id)
-
-    async def test_read_summary_without_file_id(self, client: AsyncClient):
+    async def test_read_summary_without_file_id(self, client: AsyncClient, worker_project_id, track_created):
         """
         Test: Create summary without file_id and retrieve
         Expected: file_id is None in retrieved data
         """
         payload = {
-            "project_id": 1001,
+            "project_id": worker_project_id,
             "summary_text": "파일 ID 없는 요약입니다."
         }
 
         # Create
-        create_response = await client.post("/summaries", json=payload)
+        create_response = await client.post("/summaries", **json_post_kwargs(payload))
         summary_id = create_response.json()["point_id"]
+        track_created.append(summary_id)
 
         # Read
         read_response = await client.get(f"/summaries/{summary_id}")
@@ -196,23 +188,21 @@ class TestReadSummaries:
         # Verify file_id is None
         assert read_data["payload"]["file_id"] is None
 
-        # Cleanup
-        await cleanup_summary(client, summary_id)
-
-    async def test_read_summary_created_at_format(self, client: AsyncClient):
+    async def test_read_summary_created_at_format(self, client: AsyncClient, worker_project_id, track_created):
         """
         Test: Verify created_at timestamp format
         Expected: ISO 8601 format with timezone
         """
         payload = create_test_summary(
-            project_id=1001,
+            project_id=worker_project_id,
             file_id=42,
             summary_text="타임스탬프 검증 테스트입니다."
         )
 
         # Create
-        create_response = await client.post("/summaries", json=payload)
+        create_response = await client.post("/summaries", **json_post_kwargs(payload))
         summary_id = create_response.json()["point_id"]
+        track_created.append(summary_id)
 
         # Read
         read_response = await client.get(f"/summaries/{summary_id}")
@@ -226,17 +216,15 @@ class TestReadSummaries:
         assert "T" in created_at
         assert ":" in created_at
 
-        # Cleanup
-        await cleanup_summary(client, summary_id)
 
     # === Error Cases ===
 
-    async def test_read_nonexistent_summary(self, client: AsyncClient):
+    async def test_read_nonexistent_summary(self, client: AsyncClient, fake_uuid_pool):
         """
         Test: Attempt to read summary with non-existent ID
         Expected: 404 Not Found
         """
-        fake_uuid = str(uuid.uuid4())
+        fake_uuid = fake_uuid_pool.pop()
 
         response = await client.get(f"/summaries/{fake_uuid}")
 
@@ -256,23 +244,23 @@ class TestReadSummaries:
         # Depending on validation, could be 422 or 404
         assert response.status_code in [404, 422, 500]
 
-    async def test_read_deleted_summary(self, client: AsyncClient):
+    async def test_read_deleted_summary(self, client: AsyncClient, worker_project_id):
         """
         Test: Create summary, delete it, then attempt to read
         Expected: 404 Not Found
         """
         payload = create_test_summary(
-            project_id=1001,
+            project_id=worker_project_id,
             file_id=50,
             summary_text="삭제 후 조회 테스트입니다."
         )
 
         # Create
-        create_response = await client.post("/summaries", json=payload)
+        create_response = await client.post("/summaries", **json_post_kwargs(payload))
         summary_id = create_response.json()["point_id"]
 
-        # Delete
-        delete_response = await client.delete(f"/summaries/{summary_id}")
+        # Delete (wait=true: the following read must see the effect)
+        delete_response = await client.delete(f"/summaries/{summary_id}?wait=true")
         assert delete_response.status_code == 204
 
         # Attempt to read
@@ -292,61 +280,54 @@ class TestReadSummaries:
 
     # === Integration Scenarios ===
 
-    async def test_create_read_workflow(self, client: AsyncClient):
+    async def test_create_read_workflow(self, client: AsyncClient, worker_project_id, track_created):
         """
-        Test: Complete create → read workflow
-        Expected: Data consistency between create and read
+        Test: Create response carries the stored payload
+        Expected: Data consistency verifiable from the create response alone
+        (round-trip GET behavior is covered by test_read_summary_verify_all_fields)
         """
         payload = create_test_summary(
-            project_id=1001,
+            project_id=worker_project_id,
             file_id=60,
             summary_text="생성-조회 워크플로우 테스트입니다."
         )
 
         # Create
-        create_response = await client.post("/summaries", json=payload)
+        create_response = await client.post("/summaries", **json_post_kwargs(payload))
         assert create_response.status_code == 201
         create_data = create_response.json()
+        track_created.append(create_data["point_id"])
 
-        # Read immediately
-        read_response = await client.get(f"/summaries/{create_data['point_id']}")
-        assert read_response.status_code == 200
-        read_data = read_response.json()
+        # The create response already returns the stored payload; verify
+        # consistency without a redundant GET round-trip
+        assert_summary_response(create_data, expected_payload=payload)
+        assert create_data["payload"]["summary_id"] == create_data["point_id"]
 
-        # Verify consistency
-        assert create_data["point_id"] == read_data["point_id"]
-        assert create_data["payload"]["summary_text"] == read_data["payload"]["summary_text"]
-        assert create_data["payload"]["project_id"] == read_data["payload"]["project_id"]
-
-        # Cleanup
-        await cleanup_summary(client, create_data["point_id"])
-
-    async def test_read_stability_multiple_calls(self, client: AsyncClient):
+    async def test_read_stability_multiple_calls(self, client: AsyncClient, worker_project_id, track_created):
         """
         Test: Read same summary multiple times
         Expected: Consistent data across multiple reads
         """
         payload = create_test_summary(
-            project_id=1001,
+            project_id=worker_project_id,
             file_id=61,
             summary_text="다중 조회 안정성 테스트입니다."
         )
 
         # Create
-        create_response = await client.post("/summaries", json=payload)
+        create_response = await client.post("/summaries", **json_post_kwargs(payload))
         summary_id = create_response.json()["point_id"]
+        track_created.append(summary_id)
 
-        # Read 5 times
-        read_results = []
-        for _ in range(5):
-            read_response = await client.get(f"/summaries/{summary_id}")
-            assert read_response.status_code == 200
-            read_results.append(read_response.json())
+        # Read 5 times concurrently
+        read_responses = await gather_limited(*(
+            client.get(f"/summaries/{summary_id}") for _ in range(5)
+        ))
+        assert all(r.status_code == 200 for r in read_responses)
+        read_results = [r.json() for r in read_responses]
 
         # Verify all reads are identical
         first_result = read_results[0]
         for result in read_results[1:]:
             assert result == first_result
 
-        # Cleanup
-        await cleanup_summary(client, summary_id)
@@ -3,15 +3,17 @@ Test Suite: Dense Vector Search (POST /summaries/search/dense)
 Tests for semantic similarity search using Gemini dense embeddings
 """
 
+import asyncio
+
 import pytest
 from httpx import AsyncClient
 
 from __test__.integration.summaries.conftest import (
     create_test_summary,
-    load_sample_summaries,
+    create_test_summaries_bulk,
+    gather_limited,
     assert_search_response,
-    assert_scores_descending,
-    cleanup_summaries
+    assert_scores_descending
 )
 
 
@@ -19,27 +21,17 @@ from __test__.integration.summaries.conftest import (
 class TestDenseSearch:
     """Test cases for POST /summaries/search/dense endpoint"""
 
-    async def test_basic_dense_search(self, client: AsyncClient):
+    async def test_basic_dense_search(self, client: AsyncClient, dense_search_corpus):
         """
         Test: Basic semantic search with Korean query
         Expected: Results returned with similarity scores
+
+        Read-only: searches the shared session corpus instead of creating
+        its own points (each create costs a Gemini embedding call).
         """
-        # Create test summaries
-        created_ids = []
-        summaries_data = [
-            {"text": "원고 김철수는 피고 이영희를 상대로 부동산 매매계약 이행청구소송을 제기하였습니다.", "file_id": 21},
-            {"text": "본 사건은 부동산 소유권이전등기 청구에 관한 사건입니다.", "file_id": 22},
-            {"text": "피고는 계약금, 중도금, 잔금을 모두 수령하였으나 등기 서류를 교부하지 않았습니다.", "file_id": 23},
-        ]
-
-        for data in summaries_data:
-            payload = create_test_summary(project_id=1001, file_id=data["file_id"], summary_text=data["text"])
-            response = await client.post("/summaries", json=payload)
-            created_ids.append(response.json()["point_id"])
-
-        # Search
         search_payload = {
             "query_text": "부동산 매매계약",
+            "filter_project_id": dense_search_corpus["project_id"],
             "limit": 10
         }
 
@@ -51,23 +43,19 @@ class TestDenseSearch:
         assert_search_response(data, min_results=1)
         assert_scores_descending(data["results"])
 
-        # Cleanup
-        await cleanup_summaries(client, created_ids)
-
-    async def test_dense_search_with_score_threshold(self, client: AsyncClient):
+    async def test_dense_search_with_score_threshold(self, client: AsyncClient, worker_project_id):
         """
         Test: Dense search with minimum score threshold
         Expected: Only results above threshold returned
         """
-        # Create summaries
-        created_ids = []
+        # Create summary (module bucket cleanup removes it)
         payload = create_test_summary(
-            project_id=1001,
+            project_id=worker_project_id,
             file_id=30,
             summary_text="원고는 피고를 상대로 소유권이전등기 청구소송을 제기하였습니다."
         )
         response = await client.post("/summaries", json=payload)
-        created_ids.append(response.json()["point_id"])
+        assert response.status_code == 201
 
         # Search with high threshold
         search_payload = {
@@ -86,24 +74,20 @@ class TestDenseSearch:
             if result.get("score") is not None:
                 assert result["score"] >= 0.7
 
-        # Cleanup
-        await cleanup_summaries(client, created_ids)
-
-    async def test_dense_search_limit_control(self, client: AsyncClient):
+    async def test_dense_search_limit_control(self, client: AsyncClient, worker_project_id):
         """
         Test: Control result count with limit parameter
         Expected: Exactly limit results (or fewer if not enough data)
         """
-        # Create 10 summaries
-        created_ids = []
-        for i in range(10):
-            payload = create_test_summary(
-                project_id=1001,
+        # Create 10 summaries with one batch round-trip
+        await create_test_summaries_bulk(client, [
+            create_test_summary(
+                project_id=worker_project_id,
                 file_id=40 + i,
                 summary_text=f"부동산 매매계약 관련 요약 {i + 1}번입니다."
             )
-            response = await client.post("/summaries", json=payload)
-            created_ids.append(response.json()["point_id"])
+            for i in range(10)
+        ])
 
         # Search with limit=5
         search_payload = {
@@ -119,105 +103,101 @@ class TestDenseSearch:
         # Should return exactly 5 results
         assert len(data["results"]) <= 5
 
-        # Cleanup
-        await cleanup_summaries(client, created_ids)
-
-    async def test_dense_search_filter_by_project_id(self, client: AsyncClient):
+    async def test_scroll_filter_by_project_id(self, client: AsyncClient, worker_project_id):
         """
-        Test: Filter search results by project_id
+        Test: Filter summaries by project_id via the scroll endpoint
         Expected: Only summaries from specified project
-        """
-        # Create summaries in different projects
-        project1_ids = []
-        project2_ids = []
-
-        # Project 1001
-        for i in range(3):
-            payload = create_test_summary(project_id=1001, file_id=50 + i, summary_text="프로젝트 1001 요약")
-            response = await client.post("/summaries", json=payload)
-            project1_ids.append(response.json()["point_id"])
-
-        # Project 2002
-        for i in range(3):
-            payload = create_test_summary(project_id=2002, file_id=60 + i, summary_text="프로젝트 2002 요약")
-            response = await client.post("/summaries", json=payload)
-            project2_ids.append(response.json()["point_id"])
-
-        # Search only project 1001
-        search_payload = {
-            "query_text": "프로젝트",
-            "filter_project_id": 1001,
-            "limit": 10
-        }
 
-        response = await client.post("/summaries/search/dense", json=search_payload)
+        These filter tests exercise the payload filter, not semantic
+        ranking, so they use /summaries/scroll — no query embedding and
+        no ANN traversal.
+        """
+        # Both projects' summaries created in one concurrent burst;
+        # TaskGroup cancels the rest if any create fails
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(client.post("/summaries", json=create_test_summary(
+                    project_id=project_id,
+                    file_id=file_id,
+                    summary_text=text
+                )))
+                for project_id, file_id, text in (
+                    [(worker_project_id, 50 + i, "프로젝트 1001 요약") for i in range(3)]
+                    + [(worker_project_id + 1, 60 + i, "프로젝트 2002 요약") for i in range(3)]
+                )
+            ]
+        for task in tasks:
+            assert task.result().status_code == 201
+
+        # List only the first project's summaries
+        response = await client.get(
+            f"/summaries/scroll?filter_project_id={worker_project_id}&limit=100"
+        )
 
         assert response.status_code == 200
         data = response.json()
 
-        # Verify all results from project 1001
+        # Verify all results from the first project
+        assert len(data["results"]) >= 3
         for result in data["results"]:
-            assert result["payload"]["project_id"] == 1001
-
-        # Cleanup
-        await cleanup_summaries(client, project1_ids + project2_ids)
+            assert result["payload"]["project_id"] == worker_project_id
 
-    async def test_dense_search_filter_by_file_id(self, client: AsyncClient):
+    async def test_scroll_filter_by_file_id(self, client: AsyncClient, worker_project_id):
         """
-        Test: Filter search results by file_id
+        Test: Filter summaries by file_id via the scroll endpoint
         Expected: Only summaries from specified file
         """
-        # Create summaries with different file_ids
-        created_ids = []
-
-        for file_id in [100, 101, 102]:
-            payload = create_test_summary(project_id=1001, file_id=file_id, summary_text=f"파일 {file_id} 요약")
-            response = await client.post("/summaries", json=payload)
-            created_ids.append(response.json()["point_id"])
-
-        # Search only file 100
-        search_payload = {
-            "query_text": "파일",
-            "filter_file_id": 100,
-            "limit": 10
-        }
-
-        response = await client.post("/summaries/search/dense", json=search_payload)
+        # Create summaries with different file_ids concurrently
+        responses = await gather_limited(*(
+            client.post("/summaries", json=create_test_summary(
+                project_id=worker_project_id,
+                file_id=file_id,
+                summary_text=f"파일 {file_id} 요약"
+            ))
+            for file_id in [100, 101, 102]
+        ))
+        for response in responses:
+            assert response.status_code == 201
+
+        # List only file 100 within this worker's project
+        response = await client.get(
+            f"/summaries/scroll?filter_project_id={worker_project_id}"
+            f"&filter_file_id=100&limit=100"
+        )
 
         assert response.status_code == 200
         data = response.json()
 
         # Verify all results from file 100
+        assert len(data["results"]) >= 1
         for result in data["results"]:
             assert result["payload"]["file_id"] == 100
 
-        # Cleanup
-        await cleanup_summaries(client, created_ids)
-
-    async def test_dense_search_combined_filters(self, client: AsyncClient):
+    async def test_dense_search_combined_filters(self, client: AsyncClient, worker_project_id):
         """
         Test: Combine project_id and file_id filters
         Expected: Results match both filters
         """
-        # Create summaries
-        created_ids = []
-
-        payload1 = create_test_summary(project_id=3003, file_id=200, summary_text="타겟 요약")
-        response1 = await client.post("/summaries", json=payload1)
-        created_ids.append(response1.json()["point_id"])
-
-        payload2 = create_test_summary(project_id=3003, file_id=201, summary_text="다른 파일 요약")
-        response2 = await client.post("/summaries", json=payload2)
-        created_ids.append(response2.json()["point_id"])
-
-        payload3 = create_test_summary(project_id=4004, file_id=200, summary_text="다른 프로젝트 요약")
-        response3 = await client.post("/summaries", json=payload3)
-        created_ids.append(response3.json()["point_id"])
+        # Create summaries concurrently; TaskGroup cancels the rest if
+        # any create fails
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(client.post("/summaries", json=create_test_summary(
+                    project_id=project_id, file_id=file_id, summary_text=text
+                )))
+                for project_id, file_id, text in [
+                    (worker_project_id + 2, 200, "타겟 요약"),
+                    (worker_project_id + 2, 201, "다른 파일 요약"),
+                    (worker_project_id + 3, 200, "다른 프로젝트 요약"),
+                ]
+            ]
+        for task in tasks:
+            assert task.result().status_code == 201
 
         # Search with both filters
         search_payload = {
             "query_text": "요약",
-            "filter_project_id": 3003,
+            "filter_project_id": worker_project_id + 2,
             "filter_file_id": 200,
             "limit": 10
         }
@@ -229,34 +209,21 @@ class TestDenseSearch:
 
         # Verify all results match both filters
         for result in data["results"]:
-            assert result["payload"]["project_id"] == 3003
+            assert result["payload"]["project_id"] == worker_project_id + 2
             assert result["payload"]["file_id"] == 200
 
-        # Cleanup
-        await cleanup_summaries(client, created_ids)
-
-    async def test_dense_search_semantic_similarity(self, client: AsyncClient):
+    async def test_dense_search_semantic_similarity(self, client: AsyncClient, dense_search_corpus):
         """
         Test: Verify semantic similarity (similar meaning, different words)
         Expected: Semantically similar summaries ranked high
-        """
-        # Create summaries with similar meaning
-        created_ids = []
-
-        similar_texts = [
-            "원고가 피고에게 부동산 매매대금을 지급하였으나 등기 서류를 받지 못했습니다.",
-            "계약금, 중도금, 잔금을 모두 납부했으나 소유권 이전에 필요한 서류를 교부받지 못했습니다.",
-            "날씨가 맑고 화창한 하루입니다."  # Semantically different
-        ]
 
-        for i, text in enumerate(similar_texts):
-            payload = create_test_summary(project_id=1001, file_id=70 + i, summary_text=text)
-            response = await client.post("/summaries", json=payload)
-            created_ids.append(response.json()["point_id"])
-
-        # Search with semantically similar query
+        Read-only: the shared corpus already contains two related legal
+        texts and one unrelated control sentence.
+        """
+        # Search with semantically similar query against the corpus
         search_payload = {
             "query_text": "매매대금을 지급했지만 등기에 필요한 서류를 받지 못함",
+            "filter_project_id": dense_search_corpus["project_id"],
             "limit": 10
         }
 
@@ -265,36 +232,22 @@ class TestDenseSearch:
         assert response.status_code == 200
         data = response.json()
 
-        # First two results should have higher scores than third
+        # The unrelated control text should not outrank the related ones
         if len(data["results"]) >= 2:
             scores = [r.get("score", 0) for r in data["results"][:3]]
-            # Semantically similar should rank higher
-            assert scores[0] > scores[2] or scores[1] > scores[2]
+            assert scores[0] > scores[-1] or scores[1] > scores[-1]
 
-        # Cleanup
-        await cleanup_summaries(client, created_ids)
-
-    async def test_dense_search_with_real_sample_data(self, client: AsyncClient):
+    async def test_dense_search_with_real_sample_data(self, client: AsyncClient, dense_search_corpus):
         """
         Test: Search using real legal document sample data
         Expected: Relevant legal documents found
-        """
-        # Load and create from sample data
-        samples = load_sample_summaries(limit=10)
-        created_ids = []
-
-        for sample in samples:
-            payload = {
-                "project_id": sample["project_id"],
-                "file_id": sample["file_id"],
-                "summary_text": sample["summary_text"]
-            }
-            response = await client.post("/summaries", json=payload)
-            created_ids.append(response.json()["point_id"])
 
+        Read-only: the shared corpus includes 10 real sample summaries.
+        """
         # Search for legal terms
         search_payload = {
             "query_text": "내용증명 발송",
+            "filter_project_id": dense_search_corpus["project_id"],
             "limit": 5
         }
 
@@ -305,9 +258,6 @@ class TestDenseSearch:
 
         assert_search_response(data, min_results=0)  # May or may not find results
 
-        # Cleanup
-        await cleanup_summaries(client, created_ids)
-
     async def test_dense_search_no_results(self, client: AsyncClient):
         """
         Test: Search with very high threshold or unrelated query
@@ -8,7 +8,9 @@ from httpx import AsyncClient
 
 from __test__.integration.summaries.conftest import (
     create_test_summary,
+    create_test_summaries_bulk,
     assert_search_response,
+    assert_all_payload_field,
     cleanup_summaries
 )
 
@@ -17,7 +19,7 @@ from __test__.integration.summaries.conftest import (
 class TestDiscoverSearch:
     """Test cases for POST /summaries/search/discover endpoint"""
 
-    async def test_basic_discover_search(self, client: AsyncClient):
+    async def test_basic_discover_search(self, client: AsyncClient, worker_project_id):
         """Test: Basic discovery search with context pairs"""
         created_ids = []
         texts = [
@@ -27,10 +29,10 @@ class TestDiscoverSearch:
             "날씨가 맑고 화창합니다."
         ]
 
-        for i, text in enumerate(texts):
-            payload = create_test_summary(project_id=1001, file_id=21 + i, summary_text=text)
-            response = await client.post("/summaries", json=payload)
-            created_ids.append(response.json()["point_id"])
+        created_ids = await create_test_summaries_bulk(client, [
+            create_test_summary(project_id=worker_project_id, file_id=21 + i, summary_text=text)
+            for i, text in enumerate(texts)
+        ])
 
         search_payload = {
             "target_text": "부동산 계약 관련 문서",
@@ -46,56 +48,51 @@ class TestDiscoverSearch:
 
         await cleanup_summaries(client, created_ids)
 
-    async def test_discover_multiple_context_pairs(self, client: AsyncClient):
-        """Test: Discovery with multiple context pairs"""
-        created_ids = []
-        for i in range(6):
-            payload = create_test_summary(
-                project_id=1001,
-                file_id=30 + i,
-                summary_text=f"문서 {i + 1}번입니다."
-            )
-            response = await client.post("/summaries", json=payload)
-            created_ids.append(response.json()["point_id"])
+    async def test_discover_multiple_context_pairs(self, client: AsyncClient, module_corpus):
+        """
+        Test: Discovery with multiple text-based context pairs
+
+        Read-only: pairs are passed as raw texts and embedded
+        server-side, so no points are created just to be referenced.
+        """
+        texts = module_corpus["texts"]
 
         search_payload = {
             "target_text": "관련 문서 찾기",
-            "context_pairs": [
-                {"positive": created_ids[0], "negative": created_ids[5]},
-                {"positive": created_ids[1], "negative": created_ids[4]},
-                {"positive": created_ids[2], "negative": created_ids[3]}
+            "context_text_pairs": [
+                {"positive_text": texts[0], "negative_text": texts[4]},
+                {"positive_text": texts[1], "negative_text": texts[4]},
+                {"positive_text": texts[2], "negative_text": texts[4]}
             ],
+            "filter_project_id": module_corpus["project_id"],
             "limit": 10
         }
         response = await client.post("/summaries/search/discover", json=search_payload)
 
         assert response.status_code == 200
-        await cleanup_summaries(client, created_ids)
 
-    async def test_discover_with_filters(self, client: AsyncClient):
+    async def test_discover_with_filters(self, client: AsyncClient, worker_project_id):
         """Test: Discovery search with project_id filter"""
-        created_ids = []
-        for project_id in [1001, 2002]:
-            for i in range(2):
-                payload = create_test_summary(
-                    project_id=project_id,
-                    file_id=40 + i,
-                    summary_text=f"프로젝트 {project_id} 문서 {i + 1}"
-                )
-                response = await client.post("/summaries", json=payload)
-                created_ids.append(response.json()["point_id"])
+        created_ids = await create_test_summaries_bulk(client, [
+            create_test_summary(
+                project_id=project_id,
+                file_id=40 + i,
+                summary_text=f"프로젝트 {project_id} 문서 {i + 1}"
+            )
+            for project_id in [worker_project_id, worker_project_id + 1]
+            for i in range(2)
+        ])
 
         search_payload = {
             "target_text": "문서 탐색",
             "context_pairs": [{"positive": created_ids[0], "negative": created_ids[1]}],
-            "filter_project_id": 1001,
+            "filter_project_id": worker_project_id,
             "limit": 10
         }
         response = await client.post("/summaries/search/discover", json=search_payload)
 
         assert response.status_code == 200
-        for result in response.json()["results"]:
-            assert result["payload"]["project_id"] == 1001
+        assert_all_payload_field(response.json()["results"], "project_id", worker_project_id)
 
         await cleanup_summaries(client, created_ids)
 
@@ -8,7 +8,9 @@ from httpx import AsyncClient
 
 from __test__.integration.summaries.conftest import (
     create_test_summary,
+    gather_limited,
     assert_search_response,
+    assert_all_payload_field,
     cleanup_summaries
 )
 
@@ -17,7 +19,7 @@ from __test__.integration.summaries.conftest import (
 class TestMatchTextSearch:
     """Test cases for POST /summaries/search/matchtext endpoint"""
 
-    async def test_basic_matchtext_search(self, client: AsyncClient):
+    async def test_basic_matchtext_search(self, client: AsyncClient, worker_project_id):
         """Test: Basic full-text matching without morphological analysis"""
         created_ids = []
         texts = [
@@ -26,10 +28,13 @@ class TestMatchTextSearch:
             "계약금, 중도금, 잔금을 모두 지급하였습니다."
         ]
 
-        for i, text in enumerate(texts):
-            payload = create_test_summary(project_id=1001, file_id=21 + i, summary_text=text)
-            response = await client.post("/summaries", json=payload)
-            created_ids.append(response.json()["point_id"])
+        responses = await gather_limited(*(
+            client.post("/summaries", json=create_test_summary(
+                project_id=worker_project_id, file_id=21 + i, summary_text=text
+            ))
+            for i, text in enumerate(texts)
+        ))
+        created_ids = [r.json()["point_id"] for r in responses]
 
         search_payload = {"query_text": "매매계약", "limit": 10}
         response = await client.post("/summaries/search/matchtext", json=search_payload)
@@ -39,11 +44,11 @@ class TestMatchTextSearch:
 
         await cleanup_summaries(client, created_ids)
 
-    async def test_matchtext_phrase_matching(self, client: AsyncClient):
+    async def test_matchtext_phrase_matching(self, client: AsyncClient, worker_project_id):
         """Test: Match exact phrase in summary_text"""
         created_ids = []
         payload = create_test_summary(
-            project_id=1001,
+            project_id=worker_project_id,
             file_id=30,
             summary_text="소유권이전등기 청구소송에 관한 사건입니다."
         )
@@ -58,28 +63,27 @@ class TestMatchTextSearch:
 
         await cleanup_summaries(client, created_ids)
 
-    async def test_matchtext_with_filters(self, client: AsyncClient):
+    async def test_matchtext_with_filters(self, client: AsyncClient, worker_project_id):
         """Test: MatchText with project_id and file_id filters"""
-        created_ids = []
-        for project_id in [1001, 2002]:
-            payload = create_test_summary(
+        responses = await gather_limited(*(
+            client.post("/summaries", json=create_test_summary(
                 project_id=project_id,
                 file_id=40,
                 summary_text="필터 테스트 문서입니다."
-            )
-            response = await client.post("/summaries", json=payload)
-            created_ids.append(response.json()["point_id"])
+            ))
+            for project_id in [worker_project_id, worker_project_id + 1]
+        ))
+        created_ids = [r.json()["point_id"] for r in responses]
 
         search_payload = {
             "query_text": "문서",
-            "filter_project_id": 1001,
+            "filter_project_id": worker_project_id,
             "limit": 10
         }
         response = await client.post("/summaries/search/matchtext", json=search_payload)
 
         assert response.status_code == 200
-        for result in response.json()["results"]:
-            assert result["payload"]["project_id"] == 1001
+        assert_all_payload_field(response.json()["results"], "project_id", worker_project_id)
 
         await cleanup_summaries(client, created_ids)
 
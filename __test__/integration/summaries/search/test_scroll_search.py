@@ -8,6 +8,7 @@ from httpx import AsyncClient
 
 from __test__.integration.summaries.conftest import (
     create_test_summary,
+    create_test_summaries_bulk,
     cleanup_summaries
 )
 
@@ -16,57 +17,48 @@ from __test__.integration.summaries.conftest import (
 class TestScrollSearch:
     """Test cases for POST /summaries/search/scroll endpoint"""
 
-    async def test_basic_scroll_search(self, client: AsyncClient):
-        """Test: Basic scroll search without filters"""
-        created_ids = []
-        for i in range(10):
-            payload = create_test_summary(
-                project_id=1001,
-                file_id=21 + i,
-                summary_text=f"스크롤 테스트 문서 {i + 1}번입니다."
-            )
-            response = await client.post("/summaries", json=payload)
-            created_ids.append(response.json()["point_id"])
-
-        search_payload = {"limit": 100}
+    async def test_basic_scroll_search(self, client: AsyncClient, dense_search_corpus):
+        """
+        Test: Basic scroll search
+
+        Read-only: scrolls the shared session corpus instead of creating
+        and deleting its own points.
+        """
+        search_payload = {
+            "filter_project_id": dense_search_corpus["project_id"],
+            "limit": 100
+        }
         response = await client.post("/summaries/search/scroll", json=search_payload)
 
         assert response.status_code == 200
         data = response.json()
         assert "results" in data
         assert "next_offset" in data
-
-        await cleanup_summaries(client, created_ids)
-
-    async def test_scroll_with_limit(self, client: AsyncClient):
-        """Test: Scroll search with custom limit"""
-        created_ids = []
-        for i in range(10):
-            payload = create_test_summary(project_id=1001, file_id=30 + i, summary_text=f"문서 {i + 1}")
-            response = await client.post("/summaries", json=payload)
-            created_ids.append(response.json()["point_id"])
-
-        search_payload = {"limit": 5}
+        assert len(data["results"]) >= 1
+
+    async def test_scroll_with_limit(self, client: AsyncClient, dense_search_corpus):
+        """Test: Scroll search with custom limit (read-only on the session corpus)"""
+        search_payload = {
+            "filter_project_id": dense_search_corpus["project_id"],
+            "limit": 5
+        }
         response = await client.post("/summaries/search/scroll", json=search_payload)
 
         assert response.status_code == 200
         data = response.json()
         assert len(data["results"]) <= 5
 
-        await cleanup_summaries(client, created_ids)
-
     async def test_scroll_with_project_filter(self, client: AsyncClient):
         """Test: Scroll with project_id filter"""
-        created_ids = []
-        for project_id in [1001, 2002]:
-            for i in range(3):
-                payload = create_test_summary(
-                    project_id=project_id,
-                    file_id=40 + i,
-                    summary_text=f"프로젝트 {project_id} 문서"
-                )
-                response = await client.post("/summaries", json=payload)
-                created_ids.append(response.json()["point_id"])
+        created_ids = await create_test_summaries_bulk(client, [
+            create_test_summary(
+                project_id=project_id,
+                file_id=40 + i,
+                summary_text=f"프로젝트 {project_id} 문서"
+            )
+            for project_id in [1001, 2002]
+            for i in range(3)
+        ])
 
         search_payload = {"filter_project_id": 1001, "limit": 100}
         response = await client.post("/summaries/search/scroll", json=search_payload)
@@ -79,11 +71,10 @@ class TestScrollSearch:
 
     async def test_scroll_with_file_filter(self, client: AsyncClient):
         """Test: Scroll with file_id filter"""
-        created_ids = []
-        for file_id in [100, 101]:
-            payload = create_test_summary(project_id=1001, file_id=file_id, summary_text=f"파일 {file_id}")
-            response = await client.post("/summaries", json=payload)
-            created_ids.append(response.json()["point_id"])
+        created_ids = await create_test_summaries_bulk(client, [
+            create_test_summary(project_id=1001, file_id=file_id, summary_text=f"파일 {file_id}")
+            for file_id in [100, 101]
+        ])
 
         search_payload = {"filter_file_id": 100, "limit": 100}
         response = await client.post("/summaries/search/scroll", json=search_payload)
@@ -94,16 +85,19 @@ class TestScrollSearch:
 
         await cleanup_summaries(client, created_ids)
 
-    async def test_scroll_pagination_with_offset(self, client: AsyncClient):
-        """Test: Pagination using offset"""
-        created_ids = []
-        for i in range(10):
-            payload = create_test_summary(project_id=1001, file_id=50 + i, summary_text=f"페이지 {i + 1}")
-            response = await client.post("/summaries", json=payload)
-            created_ids.append(response.json()["point_id"])
+    async def test_scroll_pagination_with_offset(self, client: AsyncClient, dense_search_corpus):
+        """
+        Test: Pagination by round-tripping the opaque cursor
 
+        Read-only: the session corpus holds more than one page at
+        limit=5, so the first page returns a next_offset to continue
+        from.
+        """
         # First page
-        search_payload = {"limit": 5}
+        search_payload = {
+            "filter_project_id": dense_search_corpus["project_id"],
+            "limit": 5
+        }
         response = await client.post("/summaries/search/scroll", json=search_payload)
         assert response.status_code == 200
         first_page = response.json()
@@ -115,8 +109,6 @@ class TestScrollSearch:
             response2 = await client.post("/summaries/search/scroll", json=search_payload)
             assert response2.status_code == 200
 
-        await cleanup_summaries(client, created_ids)
-
     async def test_scroll_invalid_limit(self, client: AsyncClient):
         """Test: Error case - invalid limit (>1000)"""
         response = await client.post("/summaries/search/scroll", json={"limit": 2000})
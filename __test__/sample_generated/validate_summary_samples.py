@@ -2,11 +2,67 @@
 생성된 Summary 샘플 파일 검증 스크립트
 """
 
-import json
+import os
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+import orjson
+
+
+def validate_one(file_path: Path):
+    """
+    단일 파일 검증 (프로세스 풀 워커에서 실행)
+
+    Returns:
+        (errors, project_id, file_id, summary_id, warning) 튜플
+    """
+    errors = []
+    project_id = file_id = summary_id = warning = None
+
+    try:
+        # orjson parses the raw bytes directly (no text decode pass)
+        data = orjson.loads(file_path.read_bytes())
+
+        # 필수 필드 확인
+        required_fields = ["summary_id", "project_id", "file_id", "summary_text", "created_at"]
+        missing_fields = [field for field in required_fields if field not in data]
+
+        if missing_fields:
+            errors.append(f"{file_path.name}: Missing fields {missing_fields}")
+            return errors, project_id, file_id, summary_id, warning
+
+        # UUID 검증
+        try:
+            uuid.UUID(data["summary_id"])
+            summary_id = data["summary_id"]
+        except (ValueError, AttributeError):
+            errors.append(f"{file_path.name}: Invalid UUID - {data['summary_id']}")
+
+        project_id = data["project_id"]
+        file_id = data["file_id"]
+
+        # created_at 검증 (ISO 8601 형식)
+        try:
+            datetime.fromisoformat(data["created_at"].replace("+00:00", ""))
+        except (ValueError, AttributeError):
+            errors.append(f"{file_path.name}: Invalid timestamp - {data['created_at']}")
+
+        # summary_text 길이 확인
+        text_length = len(data["summary_text"])
+        if text_length == 0:
+            errors.append(f"{file_path.name}: Empty summary_text")
+        elif text_length > 500:
+            warning = f"⚠️  {file_path.name}: summary_text length {text_length} chars (>500)"
+
+    except orjson.JSONDecodeError as e:
+        errors.append(f"{file_path.name}: Invalid JSON - {e}")
+    except Exception as e:
+        errors.append(f"{file_path.name}: Unexpected error - {e}")
+
+    return errors, project_id, file_id, summary_id, warning
+
 
 def validate_summary_samples():
     """50개 샘플 파일 검증"""
@@ -17,8 +73,15 @@ def validate_summary_samples():
         print(f"❌ Directory not found: {samples_dir}")
         return False
 
-    # 파일 목록 가져오기
-    json_files = sorted(samples_dir.glob("sample_*.json"))
+    # 파일 목록 가져오기 (scandir avoids the extra stat per entry that glob pays)
+    json_files = sorted(
+        (
+            Path(entry.path)
+            for entry in os.scandir(samples_dir)
+            if entry.name.startswith("sample_") and entry.name.endswith(".json")
+        ),
+        key=lambda path: path.name
+    )
     print(f"📁 Found {len(json_files)} JSON files\n")
 
     if len(json_files) != 50:
@@ -27,55 +90,25 @@ def validate_summary_samples():
 
     print("✅ File count: 50\n")
 
-    # 각 파일 검증
+    # 각 파일 검증: 파일별 검증은 독립적이므로 프로세스 풀로 병렬 처리
     errors = []
     project_ids = set()
     file_ids = set()
     summary_ids = set()
 
-    for i, file_path in enumerate(json_files, start=1):
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # 필수 필드 확인
-            required_fields = ["summary_id", "project_id", "file_id", "summary_text", "created_at"]
-            missing_fields = [field for field in required_fields if field not in data]
-
-            if missing_fields:
-                errors.append(f"{file_path.name}: Missing fields {missing_fields}")
-                continue
-
-            # UUID 검증
-            try:
-                uuid.UUID(data["summary_id"])
-                summary_ids.add(data["summary_id"])
-            except (ValueError, AttributeError):
-                errors.append(f"{file_path.name}: Invalid UUID - {data['summary_id']}")
-
-            # project_id 검증
-            project_ids.add(data["project_id"])
-
-            # file_id 검증
-            file_ids.add(data["file_id"])
-
-            # created_at 검증 (ISO 8601 형식)
-            try:
-                datetime.fromisoformat(data["created_at"].replace("+00:00", ""))
-            except (ValueError, AttributeError):
-                errors.append(f"{file_path.name}: Invalid timestamp - {data['created_at']}")
-
-            # summary_text 길이 확인
-            text_length = len(data["summary_text"])
-            if text_length == 0:
-                errors.append(f"{file_path.name}: Empty summary_text")
-            elif text_length > 500:
-                print(f"⚠️  {file_path.name}: summary_text length {text_length} chars (>500)")
-
-        except json.JSONDecodeError as e:
-            errors.append(f"{file_path.name}: Invalid JSON - {e}")
-        except Exception as e:
-            errors.append(f"{file_path.name}: Unexpected error - {e}")
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(validate_one, json_files))
+
+    for file_errors, project_id, file_id, summary_id, warning in results:
+        errors.extend(file_errors)
+        if project_id is not None:
+            project_ids.add(project_id)
+        if file_id is not None:
+            file_ids.add(file_id)
+        if summary_id is not None:
+            summary_ids.add(summary_id)
+        if warning is not None:
+            print(warning)
 
     # 전체 검증 결과
     print("="*60)
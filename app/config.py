@@ -31,6 +31,10 @@ class Settings(BaseSettings):
 
     # Concurrency Controls
     embedding_concurrency: int = 4  # Limit concurrent external embedding calls
+
+    # Embedding cache (SHA-256 keyed). Empty redis_url = in-process dict
+    embedding_cache_redis_url: str = ""
+    embedding_cache_ttl: int = 86400  # Redis entry TTL in seconds
     health_cache_ttl: float = 2.0   # Seconds to cache /health backend status
 
     # CPU-bound offloading controls for sparse embedding
@@ -0,0 +1,150 @@
+"""
+Embedding Cache
+SHA-256 keyed cache for dense embeddings (Redis-backed, in-memory fallback)
+"""
+
+import hashlib
+import json
+import logging
+from typing import Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Optional Redis backend - falls back to the in-process dict when the
+# package is missing or no redis_url is configured
+try:
+    import redis.asyncio as redis
+except ImportError:
+    redis = None
+
+_redis_client = None
+if redis is not None and settings.embedding_cache_redis_url:
+    _redis_client = redis.from_url(settings.embedding_cache_redis_url)
+
+# In-process fallback cache; bounded so a long-lived worker cannot grow
+# without limit (simple FIFO eviction is fine at this size)
+_local_cache: dict = {}
+_LOCAL_CACHE_MAX_ENTRIES = 10_000
+
+
+def cache_key(text: str, task_type: str) -> str:
+    """
+    Build the cache key for a (text, task_type) pair
+
+    Truncated SHA-256: 32 hex chars (128 bits) is far beyond collision
+    risk at this scale. task_type is part of the key because document
+    and query embeddings differ for the same text.
+    """
+    digest = hashlib.sha256(f"{task_type}:{text}".encode("utf-8")).hexdigest()
+    return f"emb:{digest[:32]}"
+
+
+def _local_set(key: str, vector: list[float]):
+    """Store in the local dict, evicting oldest entries past the cap"""
+    if len(_local_cache) >= _LOCAL_CACHE_MAX_ENTRIES:
+        for old_key in list(_local_cache)[:_LOCAL_CACHE_MAX_ENTRIES // 10]:
+            del _local_cache[old_key]
+    _local_cache[key] = vector
+
+
+async def get_cached_embedding(text: str, task_type: str) -> Optional[list[float]]:
+    """
+    Look up a cached dense embedding
+
+    Args:
+        text: Input text
+        task_type: "RETRIEVAL_DOCUMENT" or "RETRIEVAL_QUERY"
+
+    Returns:
+        Cached vector, or None on miss
+    """
+    key = cache_key(text, task_type)
+
+    if _redis_client is not None:
+        try:
+            cached = await _redis_client.get(key)
+            if cached is not None:
+                return json.loads(cached)
+            return None
+        except Exception as e:
+            logger.warning(f"Embedding cache read failed, falling back: {e}")
+
+    return _local_cache.get(key)
+
+
+async def set_cached_embedding(text: str, task_type: str, vector: list[float]):
+    """
+    Store a dense embedding in the cache
+
+    Args:
+        text: Input text
+        task_type: "RETRIEVAL_DOCUMENT" or "RETRIEVAL_QUERY"
+        vector: Embedding vector to cache
+    """
+    key = cache_key(text, task_type)
+
+    if _redis_client is not None:
+        try:
+            await _redis_client.set(
+                key, json.dumps(vector), ex=settings.embedding_cache_ttl
+            )
+            return
+        except Exception as e:
+            logger.warning(f"Embedding cache write failed, falling back: {e}")
+
+    _local_set(key, vector)
+
+
+async def get_cached_embeddings_batch(
+    texts: list[str], task_type: str
+) -> list[Optional[list[float]]]:
+    """
+    Batch lookup: one pipelined MGET against Redis (or dict reads)
+
+    Returns:
+        Per-text list of cached vectors (None for misses), same order
+    """
+    keys = [cache_key(text, task_type) for text in texts]
+
+    if _redis_client is not None:
+        try:
+            cached_values = await _redis_client.mget(keys)
+            return [
+                json.loads(value) if value is not None else None
+                for value in cached_values
+            ]
+        except Exception as e:
+            logger.warning(f"Embedding cache batch read failed, falling back: {e}")
+
+    return [_local_cache.get(key) for key in keys]
+
+
+async def set_cached_embeddings_batch(
+    texts: list[str], task_type: str, vectors: list[list[float]]
+):
+    """
+    Batch store: one pipelined MSET against Redis (or dict writes)
+
+    Args:
+        texts: Input texts (parallel to vectors)
+        task_type: "RETRIEVAL_DOCUMENT" or "RETRIEVAL_QUERY"
+        vectors: Embedding vectors to cache
+    """
+    if _redis_client is not None:
+        try:
+            pipe = _redis_client.pipeline()
+            for text, vector in zip(texts, vectors):
+                pipe.set(
+                    cache_key(text, task_type),
+                    json.dumps(vector),
+                    ex=settings.embedding_cache_ttl
+                )
+            await pipe.execute()
+            return
+        except Exception as e:
+            logger.warning(f"Embedding cache batch write failed, falling back: {e}")
+
+    for text, vector in zip(texts, vectors):
+        _local_set(cache_key(text, task_type), vector)
@@ -8,6 +8,12 @@ from google import genai
 from google.genai import types
 from app.config import settings
 from app import executors
+from app.embedding_cache import (
+    get_cached_embedding,
+    set_cached_embedding,
+    get_cached_embeddings_batch,
+    set_cached_embeddings_batch
+)
 
 # Initialize Gemini Client
 client = genai.Client(api_key=settings.gemini_api_key)
@@ -33,6 +39,11 @@ async def generate_dense_embedding(text: str) -> list[float]:
     if not text or text.strip() == "":
         return [0.0] * settings.dense_dimension
 
+    # Identical texts recur frequently (re-indexing, tests); skip the API
+    cached = await get_cached_embedding(text, "RETRIEVAL_DOCUMENT")
+    if cached is not None:
+        return cached
+
     try:
         async with _embed_semaphore:
             result = await client.aio.models.embed_content(
@@ -44,6 +55,7 @@ async def generate_dense_embedding(text: str) -> list[float]:
                 )
             )
         embedding = result.embeddings[0].values
+        await set_cached_embedding(text, "RETRIEVAL_DOCUMENT", embedding)
         return embedding
     except Exception as e:
         raise ValueError(f"Failed to generate dense embedding: {str(e)}")
@@ -76,9 +88,10 @@ async def generate_sparse_embedding(text: str) -> dict[int, float]:
     Returns:
         Sparse vector as {index: value} dictionary
     """
-    # Empty text validation - return minimal sparse vector for empty text
+    # Empty text validation - store an empty sparse vector so the point
+    # can never spuriously match a query sharing the placeholder index
     if not text or text.strip() == "":
-        return {0: 1.0}
+        return {}
 
     from app.multilingual_sparse_embedding import create_multilingual_sparse_embedding
     # Offload CPU-bound work to configured executor (thread/process)
@@ -121,6 +134,11 @@ async def generate_query_dense_embedding(query: str) -> list[float]:
     if not query or query.strip() == "":
         return [0.0] * settings.dense_dimension
 
+    # Repeated queries (pagination, retries, tests) hit the cache
+    cached = await get_cached_embedding(query, "RETRIEVAL_QUERY")
+    if cached is not None:
+        return cached
+
     try:
         async with _embed_semaphore:
             result = await client.aio.models.embed_content(
@@ -132,17 +150,28 @@ async def generate_query_dense_embedding(query: str) -> list[float]:
                 )
             )
         embedding = result.embeddings[0].values
+        await set_cached_embedding(query, "RETRIEVAL_QUERY", embedding)
         return embedding
     except Exception as e:
         raise ValueError(f"Failed to generate query embedding: {str(e)}")
 
 
+# Sparse query vectors involve no external API, but Kiwi tokenization
+# still costs tens of ms; repeated queries (retries, pagination, tests)
+# are served from this small bounded cache instead
+_sparse_query_cache: dict[str, dict[int, float]] = {}
+_SPARSE_QUERY_CACHE_MAX = 1024
+
+
 async def generate_query_sparse_embedding(query: str) -> dict[int, float]:
     """
     Generate sparse embedding for search query
     - Korean text (>= 30%): Kiwi morphological analyzer with POS filtering
     - Non-Korean text: FastEmbed BM25
 
+    Repeated query texts are answered from an in-process cache without
+    re-tokenizing.
+
     Args:
         query: Search query text
 
@@ -153,12 +182,26 @@ async def generate_query_sparse_embedding(query: str) -> dict[int, float]:
     if not query or query.strip() == "":
         return {0: 1.0}
 
+    cached = _sparse_query_cache.get(query)
+    if cached is not None:
+        return cached
+
     from app.multilingual_sparse_embedding import create_multilingual_sparse_embedding
     exec_ = getattr(executors, 'sparse_executor', None)
+    # is_query=True: uniform-weight vector dotted against the eager
+    # document-side BM25 scores
     if exec_ is None:
-        return await asyncio.to_thread(create_multilingual_sparse_embedding, query)
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(exec_, create_multilingual_sparse_embedding, query)
+        result = await asyncio.to_thread(create_multilingual_sparse_embedding, query, True)
+    else:
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(exec_, create_multilingual_sparse_embedding, query, True)
+
+    if len(_sparse_query_cache) >= _SPARSE_QUERY_CACHE_MAX:
+        # Simple FIFO eviction of the oldest tenth, mirroring the dense cache
+        for old_query in list(_sparse_query_cache)[:_SPARSE_QUERY_CACHE_MAX // 10]:
+            del _sparse_query_cache[old_query]
+    _sparse_query_cache[query] = result
+    return result
 
 
 async def batch_generate_dense_embeddings(
@@ -186,18 +229,38 @@ async def batch_generate_dense_embeddings(
     if not texts:
         return []
 
+    # Batch cache lookup (one pipelined read); only misses hit the API
+    cached_vectors = await get_cached_embeddings_batch(texts, task_type)
+    miss_indices = [i for i, vector in enumerate(cached_vectors) if vector is None]
+    if not miss_indices:
+        return cached_vectors
+
+    miss_texts = [texts[i] for i in miss_indices]
+
+    # Deduplicate identical texts within the batch (repeated fixture
+    # strings, re-indexed documents): each unique text is embedded once
+    # and fanned back out to every position that requested it
+    unique_texts = list(dict.fromkeys(miss_texts))
+
     try:
         # Although this is a single API call, protect it with the same semaphore
         async with _embed_semaphore:
             result = await client.aio.models.embed_content(
                 model=f"models/{settings.dense_model}",
-                contents=texts,  # Pass list of texts
+                contents=unique_texts,  # Only unique cache misses
                 config=types.EmbedContentConfig(
                     task_type=task_type,
                     output_dimensionality=settings.dense_dimension
                 )
             )
-        embeddings = [emb.values for emb in result.embeddings]
-        return embeddings
+        unique_embeddings = [emb.values for emb in result.embeddings]
+        await set_cached_embeddings_batch(unique_texts, task_type, unique_embeddings)
+
+        embedding_by_text = dict(zip(unique_texts, unique_embeddings))
+        miss_embeddings = [embedding_by_text[text] for text in miss_texts]
+
+        for i, embedding in zip(miss_indices, miss_embeddings):
+            cached_vectors[i] = embedding
+        return cached_vectors
     except Exception as e:
         raise ValueError(f"Failed to batch generate dense embeddings: {str(e)}")
@@ -4,7 +4,7 @@ Based on OCR v4 Qdrant implementation with Kiwi morphological analyzer
 """
 
 from typing import List, Dict
-import numpy as np
+import mmh3
 from kiwipiepy import Kiwi
 import logging
 
@@ -12,7 +12,20 @@ logger = logging.getLogger(__name__)
 
 
 class KoreanSparseEmbedding:
-    """Korean-specific sparse embedding generator using Kiwi morphological analyzer"""
+    """
+    Korean-specific sparse embedding generator using Kiwi morphological analyzer
+
+    Document-side values carry the full BM25 term-frequency/length
+    component, precomputed at indexing time (BM25S-style eager scoring);
+    query vectors are uniform-weight, so search is a plain sparse dot
+    product over the stored scores. IDF is intentionally omitted: the
+    hash-based index space keeps no corpus statistics to derive it from.
+    """
+
+    # BM25 parameters; avgdl is fixed since no corpus statistics are kept
+    K1 = 1.5
+    B = 0.75
+    AVGDL = 256.0
 
     def __init__(self):
         """Initialize Korean sparse embedding generator with Kiwi tokenizer"""
@@ -43,35 +56,53 @@ class KoreanSparseEmbedding:
             if not result:
                 return []
 
-            tokens = []
-            for token in result:
-                # Extract meaningful morphemes
-                form = token.form  # 표면형 (surface form)
-                tag = token.tag    # 품사 태그 (POS tag)
-
-                # Filter by POS tags (only meaningful morphemes)
-                if tag.startswith(('NN', 'VV', 'VA', 'MM', 'MAG', 'XR')):
-                    # NN*: 명사류 (nouns)
-                    # VV: 동사 (verbs)
-                    # VA: 형용사 (adjectives)
-                    # MM: 관형사 (determiners)
-                    # MAG: 부사 (adverbs)
-                    # XR: 어근 (root)
-                    tokens.append(form)
-                elif tag.startswith('SL'):  # 외국어 (foreign words)
-                    tokens.append(form.lower())  # lowercase for English
-
-            return tokens
+            return self._filter_tokens(result)
 
         except Exception as e:
             logger.warning(f"Tokenization failed for text: {text[:50]}... - {e}")
             # Fallback to simple space splitting
             return text.split()
 
+    @staticmethod
+    def _filter_tokens(result) -> List[str]:
+        """Extract meaningful morphemes from a Kiwi token list."""
+        tokens = []
+        for token in result:
+            form = token.form  # 표면형 (surface form)
+            tag = token.tag    # 품사 태그 (POS tag)
+
+            # Filter by POS tags (only meaningful morphemes)
+            if tag.startswith(('NN', 'VV', 'VA', 'MM', 'MAG', 'XR')):
+                # NN*: 명사류 (nouns)
+                # VV: 동사 (verbs)
+                # VA: 형용사 (adjectives)
+                # MM: 관형사 (determiners)
+                # MAG: 부사 (adverbs)
+                # XR: 어근 (root)
+                tokens.append(form)
+            elif tag.startswith('SL'):  # 외국어 (foreign words)
+                tokens.append(form.lower())  # lowercase for English
+
+        return tokens
+
+    @staticmethod
+    def _term_index(term: str) -> int:
+        """
+        Map a term to its sparse index (large space to minimize collisions)
+
+        MurmurHash3 is deterministic across processes, unlike builtin
+        hash() whose per-process randomization would make stored and
+        query-time indices disagree after a restart. No vocabulary
+        table is needed - the mapping is stateless.
+        """
+        return mmh3.hash(term, signed=False) & 0x7FFFFFFF  # ~2.1 billion index space
+
     def transform(self, text: str) -> Dict[int, float]:
         """
-        Transform text to sparse embedding (Qdrant compatible format)
-        Uses sublinear TF scaling + L2 normalization
+        Transform document text to sparse embedding (Qdrant compatible format)
+
+        Values are the eager BM25 TF/length component, so all scoring
+        work happens here at indexing time.
 
         Args:
             text: Input text
@@ -80,8 +111,20 @@ class KoreanSparseEmbedding:
             Dictionary with indices as keys and values as weights
             Format: {index: weight} for Qdrant SparseVector
         """
+        return self._sparse_from_tokens(self._tokenize(text))
+
+    def transform_query(self, text: str) -> Dict[int, float]:
+        """
+        Transform query text to a uniform-weight sparse vector
+
+        Scoring lives entirely on the document side; the query only
+        selects which precomputed term scores enter the dot product.
+        """
         tokens = self._tokenize(text)
+        return {self._term_index(term): 1.0 for term in tokens}
 
+    def _sparse_from_tokens(self, tokens: List[str]) -> Dict[int, float]:
+        """Eagerly compute BM25 term scores for a tokenized document."""
         if not tokens:
             return {}
 
@@ -90,33 +133,14 @@ class KoreanSparseEmbedding:
         for token in tokens:
             term_freq[token] = term_freq.get(token, 0) + 1
 
-        # Calculate document length for normalization
+        # Length normalization factor: saturates TF and discounts long documents
         doc_length = len(tokens)
+        length_norm = self.K1 * (1.0 - self.B + self.B * doc_length / self.AVGDL)
 
-        sparse_dict = {}
-
-        for term, freq in term_freq.items():
-            # Create hash index for term (large index space to minimize collisions)
-            term_hash = abs(hash(term)) % (2**31)  # ~2.1 billion index space
-
-            # Apply sublinear TF scaling: 1 + log(tf)
-            # This reduces the impact of high-frequency terms
-            tf_value = 1.0 + np.log(freq) if freq > 0 else 0.0
-
-            # Normalize by document length (sqrt normalization)
-            value = tf_value / np.sqrt(doc_length)
-
-            sparse_dict[term_hash] = float(value)
-
-        # L2 normalize the sparse vector
-        if sparse_dict:
-            values = list(sparse_dict.values())
-            norm = np.linalg.norm(values)
-            if norm > 0:
-                # Ensure Python float type (not numpy.float64) for Qdrant compatibility
-                sparse_dict = {k: float(v / norm) for k, v in sparse_dict.items()}
-
-        return sparse_dict
+        return {
+            self._term_index(term): float(freq * (self.K1 + 1.0) / (freq + length_norm))
+            for term, freq in term_freq.items()
+        }
 
     def batch_transform(self, texts: List[str]) -> List[Dict[int, float]]:
         """
@@ -128,11 +152,21 @@ class KoreanSparseEmbedding:
         Returns:
             List of sparse embedding dictionaries
         """
-        results = []
-        for text in texts:
-            sparse_dict = self.transform(text)
-            results.append(sparse_dict)
-        return results
+        if not texts:
+            return []
+
+        try:
+            # One call hands the whole batch to Kiwi's C++ analyzer,
+            # which parallelizes internally, instead of crossing the
+            # Python/C++ boundary once per text
+            token_lists = self.kiwi.tokenize(texts)
+            return [
+                self._sparse_from_tokens(self._filter_tokens(result))
+                for result in token_lists
+            ]
+        except Exception as e:
+            logger.warning(f"Batch tokenization failed, falling back to per-text: {e}")
+            return [self.transform(text) for text in texts]
 
 
 # Singleton instance for efficient reuse
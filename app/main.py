@@ -4,8 +4,11 @@ FastAPI application for OCR chunks CRUD and search operations
 # touch for reload (back to thread mode)
 """
 
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.routers import points, health, documentai_ocr, summaries, search_chunks, search_summaries
 from app.config import settings
@@ -18,7 +21,8 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    redirect_slashes=False  # Disable automatic trailing slash redirect
+    redirect_slashes=False,  # Disable automatic trailing slash redirect
+    default_response_class=ORJSONResponse  # C-level JSON serialization for responses
 )
 
 # CORS middleware - allow all origins for development
@@ -66,6 +70,32 @@ async def startup_event():
         print("Executors initialized for sparse offloading")
     except Exception as e:
         print(f"Failed to initialize executors: {e}")
+    # Warm the sparse embedder singleton so the first request does not
+    # pay the Kiwi model load cost
+    try:
+        from app.multilingual_sparse_embedding import warm_multilingual_sparse_embedding
+        await asyncio.to_thread(warm_multilingual_sparse_embedding)
+        print("Sparse embedder warmed (Kiwi + BM25)")
+    except Exception as e:
+        print(f"Failed to warm sparse embedder: {e}")
+    # Filter search relies on payload indexes; without them Qdrant falls
+    # back to scanning payloads linearly. Warn early instead of failing
+    # slow later (indexes are created via scripts/create_summaries_indexes.py)
+    try:
+        from app.routers.summaries import qdrant_client, COLLECTION_NAME
+        info = await qdrant_client.get_collection(COLLECTION_NAME)
+        indexed_fields = set((info.payload_schema or {}).keys())
+        missing = {"project_id", "file_id"} - indexed_fields
+        if missing:
+            print(
+                f"WARNING: {COLLECTION_NAME} is missing payload indexes for "
+                f"{sorted(missing)} - filters will scan linearly; run "
+                f"scripts/create_summaries_indexes.py"
+            )
+        else:
+            print(f"Payload indexes verified for {COLLECTION_NAME}")
+    except Exception as e:
+        print(f"Could not verify payload indexes: {e}")
 
 
 @app.on_event("shutdown")
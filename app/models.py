@@ -245,6 +245,38 @@ class SummaryResponse(BaseModel):
     score: Optional[float] = None
 
 
+class SummaryBatchCreateRequest(BaseModel):
+    """Batch create request for summaries"""
+    summaries: list[SummaryCreate]
+
+
+class SummaryBatchCreateResponse(BaseModel):
+    """Batch create response for summaries"""
+    results: list[SummaryResponse]
+    count: int
+
+
+class SummaryExistsRequest(BaseModel):
+    """Batch existence check request for summaries"""
+    point_ids: list[str]
+
+
+class SummaryExistsResponse(BaseModel):
+    """Batch existence check response for summaries"""
+    found: list[str]
+
+
+class SummaryCountRequest(BaseModel):
+    """Count request for summaries (metadata filter only)"""
+    project_id: Optional[int] = None
+    file_id: Optional[int] = None
+
+
+class SummaryCountResponse(BaseModel):
+    """Count response for summaries"""
+    count: int
+
+
 # === Summary Search Request Models ===
 
 class SummaryVectorSearchRequest(BaseModel):
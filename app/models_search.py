@@ -4,7 +4,7 @@ Models for 8 different search types across chunks and summaries
 """
 
 from typing import Optional, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 # === Common Models ===
@@ -15,6 +15,12 @@ class ContextPair(BaseModel):
     negative: str = Field(description="Negative example point ID")
 
 
+class ContextTextPair(BaseModel):
+    """Context pair given as raw texts (embedded server-side)"""
+    positive_text: str = Field(description="Positive example text")
+    negative_text: str = Field(description="Negative example text")
+
+
 # === Search Request Models ===
 
 class DenseSearchRequest(BaseModel):
@@ -54,9 +60,17 @@ class DenseSparseRRFRequest(BaseModel):
 
 
 class RecommendSearchRequest(BaseModel):
-    """Recommendation search using positive and negative examples"""
-    positive_ids: list[str] = Field(description="List of positive example point IDs")
+    """
+    Recommendation search using positive and negative examples
+
+    Examples can be given as stored point IDs or as raw texts; texts
+    are embedded server-side, so callers do not need to create
+    throwaway points just to reference them.
+    """
+    positive_ids: list[str] = Field(default_factory=list, description="List of positive example point IDs")
     negative_ids: list[str] = Field(default_factory=list, description="List of negative example point IDs")
+    positive_texts: list[str] = Field(default_factory=list, description="Positive example texts (embedded server-side)")
+    negative_texts: list[str] = Field(default_factory=list, description="Negative example texts (embedded server-side)")
     limit: int = Field(default=10, ge=1, le=100, description="Maximum number of results")
     score_threshold: Optional[float] = Field(default=None, ge=0.0, le=1.0, description="Minimum score threshold")
     strategy: Literal["average_vector", "best_score"] = Field(
@@ -66,20 +80,48 @@ class RecommendSearchRequest(BaseModel):
     filter_project_id: Optional[int] = Field(default=None, description="Filter by project ID")
     filter_file_id: Optional[int] = Field(default=None, description="Filter by file ID")
 
+    @model_validator(mode="after")
+    def _require_positive_example(self):
+        if not self.positive_ids and not self.positive_texts:
+            raise ValueError("At least one of positive_ids or positive_texts is required")
+        return self
+
 
 class DiscoverSearchRequest(BaseModel):
-    """Discovery search using context pairs to explore vector space"""
+    """
+    Discovery search using context pairs to explore vector space
+
+    Context pairs can reference stored point IDs or carry raw texts;
+    texts are embedded server-side.
+    """
     target_text: str = Field(description="Target text to discover similar items")
-    context_pairs: list[ContextPair] = Field(description="List of positive-negative context pairs")
+    context_pairs: list[ContextPair] = Field(default_factory=list, description="List of positive-negative context pairs")
+    context_text_pairs: list[ContextTextPair] = Field(
+        default_factory=list,
+        description="Context pairs given as raw texts (embedded server-side)"
+    )
     limit: int = Field(default=10, ge=1, le=100, description="Maximum number of results")
     filter_project_id: Optional[int] = Field(default=None, description="Filter by project ID")
     filter_file_id: Optional[int] = Field(default=None, description="Filter by file ID")
 
+    @model_validator(mode="after")
+    def _require_context_pair(self):
+        if not self.context_pairs and not self.context_text_pairs:
+            raise ValueError("At least one of context_pairs or context_text_pairs is required")
+        return self
+
 
 class ScrollSearchRequest(BaseModel):
-    """Scroll search for paginated large result sets"""
+    """
+    Scroll search for paginated large result sets
+
+    Pagination is keyset-based: offset is the opaque cursor returned as
+    next_offset by the previous page (a Qdrant point ID), so page-N
+    latency is constant - the server never walks and discards prior
+    points the way a numeric offset would.
+    """
     limit: int = Field(default=100, ge=1, le=1000, description="Number of results per page")
-    offset: Optional[str] = Field(default=None, description="Pagination offset from previous response")
+    offset: Optional[str] = Field(default=None, description="Opaque cursor (next_offset) from the previous response")
     filter_project_id: Optional[int] = Field(default=None, description="Filter by project ID")
     filter_file_id: Optional[int] = Field(default=None, description="Filter by file ID")
     filter_language: Optional[str] = Field(default=None, description="Filter by language")
@@ -90,6 +132,7 @@ class FilterSearchRequest(BaseModel):
     """Metadata filter-based search (existing model, kept for compatibility)"""
     project_id: Optional[int] = None
     file_id: Optional[int] = None
+    summary_ids: Optional[list[str]] = None
     pages: Optional[list[int]] = None
     language: Optional[str] = None
     limit: int = Field(default=10, ge=1, le=100)
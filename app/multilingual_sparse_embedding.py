@@ -58,12 +58,14 @@ class MultilingualSparseEmbedding:
         korean_ratio = korean_chars / total_chars
         return korean_ratio >= 0.3
 
-    def transform(self, text: str) -> Dict[int, float]:
+    def transform(self, text: str, is_query: bool = False) -> Dict[int, float]:
         """
         Generate sparse embedding using appropriate embedder based on language detection
 
         Args:
             text: Input text
+            is_query: True for search queries (uniform-weight vectors that
+                dot against the eager document-side scores)
 
         Returns:
             Dictionary with indices as keys and values as weights
@@ -77,7 +79,10 @@ class MultilingualSparseEmbedding:
 
             # Use Korean embedder for Korean text
             if is_korean and self.korean_embedder:
-                sparse_dict = self.korean_embedder.transform(text)
+                if is_query:
+                    sparse_dict = self.korean_embedder.transform_query(text)
+                else:
+                    sparse_dict = self.korean_embedder.transform(text)
                 if sparse_dict:
                     # Ensure Python int/float types for Qdrant compatibility
                     sparse_dict = {int(k): float(v) for k, v in sparse_dict.items()}
@@ -86,7 +91,10 @@ class MultilingualSparseEmbedding:
 
             # Fallback to FastEmbed for non-Korean text or if Korean embedder fails
             if self.fastembed_embedder:
-                embeddings = list(self.fastembed_embedder.embed([text]))
+                if is_query:
+                    embeddings = list(self.fastembed_embedder.query_embed([text]))
+                else:
+                    embeddings = list(self.fastembed_embedder.embed([text]))
 
                 if embeddings and len(embeddings) > 0:
                     sparse_embedding = embeddings[0]
@@ -174,12 +182,13 @@ class MultilingualSparseEmbedding:
 _multilingual_sparse_instance = None
 
 
-def create_multilingual_sparse_embedding(text: str) -> Dict[int, float]:
+def create_multilingual_sparse_embedding(text: str, is_query: bool = False) -> Dict[int, float]:
     """
     Create sparse embedding for text using singleton multilingual instance
 
     Args:
         text: Input text (any language)
+        is_query: True for search queries (uniform-weight vectors)
 
     Returns:
         Dictionary with indices as keys and values as weights
@@ -189,7 +198,18 @@ def create_multilingual_sparse_embedding(text: str) -> Dict[int, float]:
     if _multilingual_sparse_instance is None:
         _multilingual_sparse_instance = MultilingualSparseEmbedding()
 
-    return _multilingual_sparse_instance.transform(text)
+    return _multilingual_sparse_instance.transform(text, is_query=is_query)
+
+
+def warm_multilingual_sparse_embedding() -> None:
+    """
+    Instantiate the singleton and run one analysis up front
+
+    Kiwi's model load (~100-300 ms) otherwise lands on the first request
+    that touches the sparse path; calling this at startup pays it once
+    per process before traffic arrives.
+    """
+    create_multilingual_sparse_embedding("워밍업")
 
 
 def create_multilingual_sparse_embeddings(texts: List[str]) -> List[Dict[int, float]]:
@@ -4,6 +4,7 @@ Search Router for OCR Summaries
 """
 
 import asyncio
+import functools
 from typing import Optional
 from fastapi import APIRouter, HTTPException, status
 from qdrant_client import AsyncQdrantClient
@@ -11,6 +12,7 @@ from qdrant_client.models import (
     Filter,
     FieldCondition,
     MatchValue,
+    MatchAny,
     MatchText,
     SparseVector,
     NamedSparseVector,
@@ -33,7 +35,8 @@ from app.models_search import (
 )
 from app.embeddings import (
     generate_query_dense_embedding,
-    generate_query_sparse_embedding
+    generate_query_sparse_embedding,
+    batch_generate_dense_embeddings
 )
 from app.services.rrf_fusion import reciprocal_rank_fusion
 
@@ -48,6 +51,42 @@ qdrant_client = AsyncQdrantClient(
 COLLECTION_NAME = "ocr_summaries"
 
 
+@functools.lru_cache(maxsize=128)
+def _cached_filter(
+    project_id: Optional[int] = None,
+    file_id: Optional[int] = None,
+    language: Optional[str] = None,
+    summary_ids: Optional[tuple] = None
+) -> Optional[Filter]:
+    """
+    Build (and memoize) a Qdrant Filter for the given field values
+
+    Clients tend to repeat the same filter shapes (e.g. project_id +
+    limit) across many requests, so caching the constructed Filter
+    skips the per-request pydantic model instantiation. The returned
+    Filter is treated as immutable; callers must not mutate it.
+    """
+    conditions = []
+    if project_id is not None:
+        conditions.append(
+            FieldCondition(key="project_id", match=MatchValue(value=project_id))
+        )
+    if file_id is not None:
+        conditions.append(
+            FieldCondition(key="file_id", match=MatchValue(value=file_id))
+        )
+    if language is not None:
+        conditions.append(
+            FieldCondition(key="language", match=MatchValue(value=language))
+        )
+    if summary_ids:
+        # One indexed MatchAny lookup replaces N individual retrieves
+        conditions.append(
+            FieldCondition(key="summary_id", match=MatchAny(any=list(summary_ids)))
+        )
+    return Filter(must=conditions) if conditions else None
+
+
 @router.post("/dense", response_model=SearchResponse)
 async def dense_search(request: DenseSearchRequest):
     """
@@ -61,18 +100,8 @@ async def dense_search(request: DenseSearchRequest):
         # Generate dense query embedding
         query_vector = await generate_query_dense_embedding(request.query_text)
 
-        # Build filter
-        filter_conditions = []
-        if request.filter_project_id is not None:
-            filter_conditions.append(
-                FieldCondition(key="project_id", match=MatchValue(value=request.filter_project_id))
-            )
-        if request.filter_file_id is not None:
-            filter_conditions.append(
-                FieldCondition(key="file_id", match=MatchValue(value=request.filter_file_id))
-            )
-
-        search_filter = Filter(must=filter_conditions) if filter_conditions else None
+        # Build filter (memoized across requests with the same shape)
+        search_filter = _cached_filter(request.filter_project_id, request.filter_file_id)
 
         # Dense vector search
         results = await qdrant_client.search(
@@ -358,6 +387,7 @@ async def recommend_search(request: RecommendSearchRequest):
 
     - Find similar summaries to positive examples
     - Avoid summaries similar to negative examples
+    - Examples may be stored point IDs or raw texts (embedded server-side)
     - Strategies: average_vector, best_score
     - Best for: "more like this", "less like that" searches
     """
@@ -375,11 +405,22 @@ async def recommend_search(request: RecommendSearchRequest):
 
         search_filter = Filter(must=filter_conditions) if filter_conditions else None
 
+        # Inline example texts are embedded in a single batch call and
+        # passed to Qdrant as raw vectors alongside any point IDs, so
+        # callers never have to upsert throwaway points to reference them
+        positive: list = list(request.positive_ids)
+        negative: list = list(request.negative_ids)
+        example_texts = request.positive_texts + request.negative_texts
+        if example_texts:
+            example_vectors = await batch_generate_dense_embeddings(example_texts)
+            positive.extend(example_vectors[:len(request.positive_texts)])
+            negative.extend(example_vectors[len(request.positive_texts):])
+
         # Recommendation search
         results = await qdrant_client.recommend(
             collection_name=COLLECTION_NAME,
-            positive=request.positive_ids,
-            negative=request.negative_ids,
+            positive=positive,
+            negative=negative,
             limit=request.limit,
             score_threshold=request.score_threshold,
             query_filter=search_filter,
@@ -418,6 +459,7 @@ async def discover_search(request: DiscoverSearchRequest):
     Discovery search using context pairs to explore vector space
 
     - Uses positive-negative context pairs to define search space
+    - Pairs may reference stored point IDs or carry raw texts
     - Finds summaries similar to target within context constraints
     - Best for: exploratory search, context-aware discovery
     """
@@ -425,12 +467,29 @@ async def discover_search(request: DiscoverSearchRequest):
         # Generate target embedding
         target_vector = await generate_query_dense_embedding(request.target_text)
 
-        # Build context pairs
+        # Build context pairs from point IDs
         context = [
             ContextExamplePair(positive=pair.positive, negative=pair.negative)
             for pair in request.context_pairs
         ]
 
+        # Text-based pairs: embed all texts in one batch call and pass
+        # the vectors directly, avoiding throwaway point creation
+        if request.context_text_pairs:
+            pair_texts = [
+                text
+                for pair in request.context_text_pairs
+                for text in (pair.positive_text, pair.negative_text)
+            ]
+            pair_vectors = await batch_generate_dense_embeddings(pair_texts)
+            context.extend(
+                ContextExamplePair(
+                    positive=pair_vectors[i],
+                    negative=pair_vectors[i + 1]
+                )
+                for i in range(0, len(pair_vectors), 2)
+            )
+
         # Build filter
         filter_conditions = []
         if request.filter_project_id is not None:
@@ -497,7 +556,8 @@ async def scroll_search(request: ScrollSearchRequest):
     Scroll search for paginated large result sets
 
     - Efficiently retrieve large numbers of results
-    - Pagination support with offset
+    - Keyset pagination: pass the returned next_offset back as offset;
+      Qdrant continues from that point ID, so deep pages stay O(1)
     - Supports metadata filtering
     - Best for: bulk operations, data export
     """
@@ -561,27 +621,18 @@ async def filter_search(request: FilterSearchRequest):
     """
     Metadata filter-based search (no vector search)
 
-    - Filter by project_id, file_id, language, pages
+    - Filter by project_id, file_id, summary_ids, language, pages
     - No semantic or keyword search
     - Best for: metadata-only queries
     """
     try:
-        filter_conditions = []
-
-        if request.project_id is not None:
-            filter_conditions.append(
-                FieldCondition(key="project_id", match=MatchValue(value=request.project_id))
-            )
-        if request.file_id is not None:
-            filter_conditions.append(
-                FieldCondition(key="file_id", match=MatchValue(value=request.file_id))
-            )
-        if request.language is not None:
-            filter_conditions.append(
-                FieldCondition(key="language", match=MatchValue(value=request.language))
-            )
-
-        search_filter = Filter(must=filter_conditions) if filter_conditions else None
+        # Build filter (memoized across requests with the same shape)
+        search_filter = _cached_filter(
+            request.project_id,
+            request.file_id,
+            request.language,
+            tuple(request.summary_ids) if request.summary_ids else None
+        )
 
         # Scroll with numeric offset support
         # Note: Qdrant scroll() offset is point ID-based, so we fetch extra and skip manually
@@ -3,11 +3,12 @@ Summaries Router
 CRUD and search endpoints for OCR summaries
 """
 
+import asyncio
 import uuid
 import logging
 from datetime import datetime, timezone
 from typing import Optional
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
 from qdrant_client import AsyncQdrantClient
 
 logger = logging.getLogger(__name__)
@@ -17,7 +18,8 @@ from qdrant_client.models import (
     FieldCondition,
     MatchValue,
     MatchText,
-    SparseVector
+    SparseVector,
+    FilterSelector
 )
 
 from app.config import settings
@@ -29,12 +31,20 @@ from app.models import (
     SummaryVectorSearchRequest,
     SummaryKeywordSearchRequest,
     SummaryHybridSearchRequest,
-    SummarySearchResponse
+    SummarySearchResponse,
+    SummaryBatchCreateRequest,
+    SummaryBatchCreateResponse,
+    SummaryExistsRequest,
+    SummaryExistsResponse,
+    SummaryCountRequest,
+    SummaryCountResponse,
+    BatchDeleteRequest
 )
 from app.embeddings import (
     generate_dense_embedding,
     generate_sparse_embedding,
-    generate_query_dense_embedding
+    generate_query_dense_embedding,
+    batch_generate_dense_embeddings
 )
 
 router = APIRouter(prefix="/summaries", tags=["Summaries"])
@@ -128,6 +138,140 @@ async def create_summary(summary: SummaryCreate):
         )
 
 
+@router.post("/batch", response_model=SummaryBatchCreateResponse, status_code=status.HTTP_201_CREATED)
+async def batch_create_summaries(request: SummaryBatchCreateRequest):
+    """
+    Create multiple summaries in a single request
+
+    Dense embeddings for all summaries are generated in one batched Gemini
+    call; sparse embeddings are generated concurrently. All points are
+    upserted to Qdrant in a single operation.
+    """
+    try:
+        summaries = request.summaries
+        if not summaries:
+            return SummaryBatchCreateResponse(results=[], count=0)
+
+        # Auto-generate tracing fields if not provided
+        for summary in summaries:
+            if summary.correlation_id is None:
+                summary.correlation_id = str(uuid.uuid4())
+            if summary.request_timestamp is None:
+                summary.request_timestamp = datetime.now(timezone.utc).isoformat()
+
+        logger.info(
+            f"Batch create summaries request: count={len(summaries)}, "
+            f"project_ids={sorted({s.project_id for s in summaries})}"
+        )
+
+        point_ids = [_validate_or_generate_uuid(s.summary_id) for s in summaries]
+        texts = [s.summary_text for s in summaries]
+
+        # Dense embeddings: one batched API call for non-empty texts,
+        # zero vectors for empty ones (mirrors generate_dense_embedding)
+        dense_vectors = [[0.0] * settings.dense_dimension for _ in texts]
+        non_empty = [(idx, text) for idx, text in enumerate(texts) if text and text.strip()]
+        if non_empty:
+            batch_vectors = await batch_generate_dense_embeddings([text for _, text in non_empty])
+            for (idx, _), vector in zip(non_empty, batch_vectors):
+                dense_vectors[idx] = vector
+
+        # Sparse embeddings in parallel
+        sparse_vector_dicts = await asyncio.gather(
+            *(generate_sparse_embedding(text) for text in texts)
+        )
+
+        points = []
+        results = []
+        for summary, point_id, dense_vector, sparse_vector_dict in zip(
+            summaries, point_ids, dense_vectors, sparse_vector_dicts
+        ):
+            sparse_indices = [int(k) for k in sparse_vector_dict.keys()]
+            sparse_values = [float(v) for v in sparse_vector_dict.values()]
+
+            payload = SummaryPayload(
+                summary_id=point_id,
+                **summary.model_dump(exclude={"summary_id"})
+            ).model_dump()
+
+            points.append(PointStruct(
+                id=point_id,
+                vector={
+                    settings.dense_vector_name: dense_vector,
+                    settings.sparse_vector_name: SparseVector(
+                        indices=sparse_indices,
+                        values=sparse_values
+                    )
+                },
+                payload=payload
+            ))
+            results.append(SummaryResponse(
+                point_id=point_id,
+                payload=SummaryPayload(**payload)
+            ))
+
+        # Single upsert for all points
+        await qdrant_client.upsert(
+            collection_name=COLLECTION_NAME,
+            points=points
+        )
+
+        return SummaryBatchCreateResponse(results=results, count=len(results))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to batch create summaries: {str(e)}"
+        )
+
+
+@router.get("/scroll", response_model=SummarySearchResponse)
+async def scroll_summaries(
+    filter_project_id: Optional[int] = None,
+    filter_file_id: Optional[int] = None,
+    limit: int = Query(default=100, ge=1, le=1000)
+):
+    """
+    List summaries matching a metadata filter via Qdrant scroll
+
+    No query embedding and no ANN traversal — when relevance ranking is
+    not needed, a payload-filtered scroll is far cheaper than a dense
+    search for the same filter.
+    """
+    try:
+        conditions = []
+        if filter_project_id is not None:
+            conditions.append(
+                FieldCondition(key="project_id", match=MatchValue(value=filter_project_id))
+            )
+        if filter_file_id is not None:
+            conditions.append(
+                FieldCondition(key="file_id", match=MatchValue(value=filter_file_id))
+            )
+        scroll_filter = Filter(must=conditions) if conditions else None
+
+        points, _next_offset = await qdrant_client.scroll(
+            collection_name=COLLECTION_NAME,
+            scroll_filter=scroll_filter,
+            with_payload=True,
+            with_vectors=False,
+            limit=limit
+        )
+
+        results = [
+            SummaryResponse(
+                point_id=str(point.id),
+                payload=SummaryPayload(**point.payload)
+            )
+            for point in points
+        ]
+        return SummarySearchResponse(results=results, total=len(results), limit=limit)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to scroll summaries: {str(e)}"
+        )
+
+
 @router.get("/{summary_id}", response_model=SummaryResponse)
 async def get_summary(summary_id: str):
     """Retrieve a summary by ID"""
@@ -179,8 +323,15 @@ async def update_summary(summary_id: str, update: SummaryUpdate):
         # Merge updates
         update_dict = update.model_dump(exclude_unset=True)
 
-        # If summary_text updated, regenerate embeddings and upsert entire point
-        if "summary_text" in update_dict:
+        # If summary_text actually changed, regenerate embeddings and
+        # upsert the entire point. Sending the same text again (idempotent
+        # retries, metadata-heavy clients) keeps the existing vectors and
+        # takes the payload-only path below.
+        text_changed = (
+            "summary_text" in update_dict
+            and update_dict["summary_text"] != existing[0].payload.get("summary_text")
+        )
+        if text_changed:
             dense_vector = await generate_dense_embedding(update_dict["summary_text"])
             sparse_vector_dict = await generate_sparse_embedding(update_dict["summary_text"])
 
@@ -237,13 +388,136 @@ async def update_summary(summary_id: str, update: SummaryUpdate):
         )
 
 
+@router.post("/exists", response_model=SummaryExistsResponse)
+async def check_summaries_exist(request: SummaryExistsRequest):
+    """
+    Check which of the given summary IDs exist
+
+    A single Qdrant retrieve replaces N individual GET round-trips.
+    """
+    try:
+        points = await qdrant_client.retrieve(
+            collection_name=COLLECTION_NAME,
+            ids=request.point_ids,
+            with_payload=False,
+            with_vectors=False
+        )
+        return SummaryExistsResponse(found=[str(point.id) for point in points])
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to check summary existence: {str(e)}"
+        )
+
+
+@router.post("/count", response_model=SummaryCountResponse)
+async def count_summaries(request: SummaryCountRequest):
+    """
+    Count summaries matching a metadata filter
+
+    Uses Qdrant's native count (exact=True), which skips payload
+    serialization entirely — much cheaper than a filter search when only
+    the number of matches is needed.
+    """
+    try:
+        filter_conditions = []
+        if request.project_id is not None:
+            filter_conditions.append(
+                FieldCondition(key="project_id", match=MatchValue(value=request.project_id))
+            )
+        if request.file_id is not None:
+            filter_conditions.append(
+                FieldCondition(key="file_id", match=MatchValue(value=request.file_id))
+            )
+        count_filter = Filter(must=filter_conditions) if filter_conditions else None
+
+        result = await qdrant_client.count(
+            collection_name=COLLECTION_NAME,
+            count_filter=count_filter,
+            exact=True
+        )
+        return SummaryCountResponse(count=result.count)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to count summaries: {str(e)}"
+        )
+
+
+@router.post("/batch-delete", response_model=dict)
+async def batch_delete_summaries(request: BatchDeleteRequest, wait: bool = False):
+    """
+    Delete multiple summaries in a single Qdrant operation
+
+    With wait=false (default) the call returns after the WAL append;
+    pass wait=true when a following read must observe the deletion.
+    """
+    try:
+        await qdrant_client.delete(
+            collection_name=COLLECTION_NAME,
+            points_selector=request.point_ids,
+            wait=wait
+        )
+        return {
+            "message": f"Deleted {len(request.point_ids)} summaries successfully",
+            "count": len(request.point_ids)
+        }
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to batch delete summaries: {str(e)}"
+        )
+
+
+@router.delete("", response_model=dict)
+async def delete_summaries_by_filter(
+    filter_project_id: int,
+    filter_file_id: Optional[int] = None,
+    wait: bool = False
+):
+    """
+    Delete all summaries matching a metadata filter
+
+    A single Qdrant filter-delete replaces one DELETE round-trip per
+    point — test teardown and project-level purges drop a whole
+    project_id bucket in one operation. filter_project_id is mandatory
+    so a bare DELETE can never wipe the collection.
+    """
+    try:
+        conditions = [
+            FieldCondition(key="project_id", match=MatchValue(value=filter_project_id))
+        ]
+        if filter_file_id is not None:
+            conditions.append(
+                FieldCondition(key="file_id", match=MatchValue(value=filter_file_id))
+            )
+
+        await qdrant_client.delete(
+            collection_name=COLLECTION_NAME,
+            points_selector=FilterSelector(filter=Filter(must=conditions)),
+            wait=wait
+        )
+        return {"message": f"Deleted summaries for project_id={filter_project_id}"}
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to delete summaries by filter: {str(e)}"
+        )
+
+
 @router.delete("/{summary_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_summary(summary_id: str):
-    """Delete a summary"""
+async def delete_summary(summary_id: str, wait: bool = False):
+    """
+    Delete a summary
+
+    With wait=false (default) the call returns after the WAL append;
+    pass wait=true when a following read must observe the deletion.
+    """
     try:
         await qdrant_client.delete(
             collection_name=COLLECTION_NAME,
-            points_selector=[summary_id]
+            points_selector=[summary_id],
+            wait=wait
         )
     except Exception as e:
         raise HTTPException(
@@ -26,7 +26,7 @@ async def create_indexes():
 
     try:
         # 1. project_id 인덱스 (INTEGER)
-        print("\n[1/2] Creating index for project_id (INTEGER)...")
+        print("\n[1/3] Creating index for project_id (INTEGER)...")
         await client.create_payload_index(
             collection_name=COLLECTION,
             field_name="project_id",
@@ -35,7 +35,7 @@ async def create_indexes():
         print("✅ project_id index created successfully")
 
         # 2. file_id 인덱스 (INTEGER)
-        print("\n[2/2] Creating index for file_id (INTEGER)...")
+        print("\n[2/3] Creating index for file_id (INTEGER)...")
         await client.create_payload_index(
             collection_name=COLLECTION,
             field_name="file_id",
@@ -43,6 +43,15 @@ async def create_indexes():
         )
         print("✅ file_id index created successfully")
 
+        # 3. summary_id 인덱스 (KEYWORD) - filter search by ID list
+        print("\n[3/3] Creating index for summary_id (KEYWORD)...")
+        await client.create_payload_index(
+            collection_name=COLLECTION,
+            field_name="summary_id",
+            field_schema=PayloadSchemaType.KEYWORD
+        )
+        print("✅ summary_id index created successfully")
+
         print("\n" + "=" * 60)
         print("✅ All indexes created successfully!")
         print("=" * 60)